@@ -196,6 +196,10 @@ def _load_mapping_data(csv_path=DEFAULT_CSV_PATH):
         if invalid_weekdays:
             print(f"Warning: Found unexpected weekday values: {invalid_weekdays}")
 
+        # Store weekdays as a categorical: int8 codes over ~7 categories, so
+        # unique() and equality filters work on the codes instead of strings
+        df[WEEKDAY_COLUMN] = df[WEEKDAY_COLUMN].astype('category')
+
         # Sort by Gregorian date for consistent ordering and reset index
         df = df.sort_values(['Gregorian Year', 'Gregorian Month', 'Gregorian Day'])
         df = df.reset_index(drop=True)
@@ -71,6 +71,8 @@ def normalize_date_output(match_component: Dict[str, Optional[str]], lang="ar")
         → {"year": "2024", "month": "March", "weekday": "Friday", "day": "15", "century": 21, "calendar": ""}
     """
     # Initialize normalized components - start fresh
+    # Only the components normalized below are written here; every other key is
+    # copied once at the end instead of being cloned up front and overwritten
     n_match_component = {}
     calendar = ""
     force_calendar = False
@@ -79,17 +81,11 @@ def normalize_date_output(match_component: Dict[str, Optional[str]], lang="ar")
     def safe_strip(value):
         return value.strip() if isinstance(value, str) and value is not None else value
 
-    # Process each component - handle both flat and nested structures
-    # Some date parsers return nested dicts, others return flat structures
-    for key, value in match_component.items():
-        if isinstance(value, dict):
-            # Nested structure - recursively process sub-components
-            n_match_component[key] = {}
-            for sub_key, sub_value in value.items():
-                n_match_component[key][sub_key] = safe_strip(sub_value)
-        else:
-            # Flat structure - initialize as needed for normalization functions
-            n_match_component[key] = safe_strip(value)
+    # Read each component once
+    era = match_component.get("era")
+    month = match_component.get("month")
+    weekday = match_component.get("weekday")
+    year = match_component.get("year")
 
     # Extract calendar if specified - could be empty string, None, or actual calendar name
     calendar = match_component.get("calendar", "") or ""
@@ -97,10 +93,10 @@ def normalize_date_output(match_component: Dict[str, Optional[str]], lang="ar")
     # Process era and extract calendar information
     # Era processing might give us calendar info (e.g., "AD" implies Gregorian, "هـ" implies Islamic)
     # Examples: "AD"/"CE" → Gregorian, "AH"/"هـ" → Islamic, "BE" → Buddhist
-    if match_component.get("era"):
+    if era:
         try:
             n_era, n_calendar = normalize_era(
-                era=match_component.get("era", ""),
+                era=era,
                 lang=lang
             )
             n_match_component["era"] = n_era
@@ -110,15 +106,15 @@ def normalize_date_output(match_component: Dict[str, Optional[str]], lang="ar")
         except (NameError, TypeError):
             # Handle case where normalize_era function is not defined
             # Graceful degradation - just use the raw era value
-            n_match_component["era"] = safe_strip(match_component.get("era"))
+            n_match_component["era"] = safe_strip(era)
 
     # Process month - this might also give us calendar information
     # Different calendars have different month names/numbers
     # Examples: "January" → Gregorian, "رمضان" → Islamic, "Tishrei" → Hebrew
-    if match_component.get("month"):
+    if month:
         try:
             n_month, meta = normalize_month(
-                month=match_component.get("month", ""),
+                month=month,
                 lang=lang,
                 calendar=calendar,
                 force_calendar=force_calendar
@@ -130,14 +126,14 @@ def normalize_date_output(match_component: Dict[str, Optional[str]], lang="ar")
                 calendar = meta.get("n_calendar", "")
         except (NameError, TypeError):
             # Fallback to raw month value if normalization fails
-            n_match_component["month"] = safe_strip(match_component.get("month"))
+            n_match_component["month"] = safe_strip(month)
 
     # Process weekday - similar to month processing
     # Examples: "الجمعة" → "Friday", "Sunday" → "Sunday", "יום ראשון" → "Sunday"
-    if match_component.get("weekday"):
+    if weekday:
         try:
             n_weekday, meta = normalize_weekday(
-                weekday=match_component.get("weekday", ""),
+                weekday=weekday,
                 lang=lang
             )
             n_match_component["weekday"] = n_weekday
@@ -146,24 +142,40 @@ def normalize_date_output(match_component: Dict[str, Optional[str]], lang="ar")
                 calendar = meta.get("n_calendar", "")
         except (NameError, TypeError):
             # Fallback to raw weekday value
-            n_match_component["weekday"] = safe_strip(match_component.get("weekday"))
+            n_match_component["weekday"] = safe_strip(weekday)
     else:
         n_match_component["weekday"] = None
 
     # Process simple components (day, year) - these don't need special normalization
     # Just clean them up and pass them through
-    for component in ["day", "year"]:
-        value = match_component.get(component)
-        n_match_component[component] = safe_strip(value) if value is not None else None
+    day = match_component.get("day")
+    n_match_component["day"] = safe_strip(day) if day is not None else None
+    n_match_component["year"] = safe_strip(year) if year is not None else None
+
+    # Parse the year once; non-numeric years stay as-is and infer nothing
+    try:
+        year_number = int(year) if year else None
+    except (TypeError, ValueError):
+        year_number = None
 
     # Auto-calculate century if we have a year but no explicit century
     # Century calculation is universal across calendar systems
-    if (not match_component.get("century")) and match_component.get("year"):
-        n_match_component["century"] = get_century_from_year(match_component.get("year"))[0]
+    if (not match_component.get("century")) and year:
+        n_match_component["century"] = get_century_from_year(year_number)[0]
 
-    if (calendar or (calendar == "")) and int(str(match_component.get("year")).strip()):
-        if int(str(match_component.get("year")).strip()) > 1446 :
-            calendar = 'gregorian'
+    # Years past the current Hijri year can only be Gregorian
+    if year_number is not None and year_number > 1446 and not calendar:
+        calendar = 'gregorian'
+
+    # Copy the remaining components (e.g. "century", or nested dicts from complex
+    # parsers), stripping flat values and the values of nested sub-dicts
+    for key, value in match_component.items():
+        if key not in n_match_component:
+            if isinstance(value, dict):
+                n_match_component[key] = {sub_key: safe_strip(sub_value)
+                                          for sub_key, sub_value in value.items()}
+            else:
+                n_match_component[key] = safe_strip(value)
 
     # Set final calendar - this gets passed along for downstream processing
     n_match_component["calendar"] = calendar
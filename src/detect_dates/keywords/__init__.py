@@ -11,6 +11,7 @@ from .constants import (
     Language,
     Calendar,
     OutputFormat,
+    EraCode,
     PRECISION_LEVELS,
     CALENDAR_ALIASES,
     SUPPORTED_LANGUAGES,
@@ -27,11 +28,12 @@ from .weekday import (
     weekdays_variations_list,
     weekdays_standard_keywords,
     weekdays_keywords,
+    resolve_weekday_token,  # Any weekday spelling -> (day index, language) candidates
 )
 
 from .era import (
+    EraRecord,  # Immutable era keyword record
     era_standard_keywords,  # All era keywords for normalization
-    era_keywords,  # All era keywords for normalization
 )
 
 
@@ -39,6 +41,9 @@ from .month import (
     months_standard_keywords,  # Standard month keywords
     months_variations_list,  # Comprehensive month keywords list
     months_keywords,  # All month keywords for normalization
+    MonthRecord,  # Immutable month keyword record
+    resolve_num_month,  # Numeric month string -> month number
+    resolve_month_token,  # Any month spelling -> (month number, calendar) candidates
 )
 
 
@@ -46,9 +51,60 @@ from .numeric_words import (
     numeric_words_keywords,  # All numeric words for normalization
 )
 
-from .search import search_in_keywords
+from .search import (
+    search_in_keywords,
+    search_in_keywords_batch,
+    find_months,
+    find_month,
+    get_month_regex,
+    get_month_trie,
+)
+
+from .trie import KeywordTrie
+
+from ._util import _lazy_module_attributes
+
+from .scan import scan_en, scan_indicators, get_indicator_regex
 
-from .separator import indicators_keywords
+from .separator import (
+    indicators_keywords,
+    INDICATORS_BY_LANG,
+    INDICATORS_BY_COMPONENT,
+    IS_PUNCTUATION_SEPARATOR,
+    match_punctuation_separator,
+)
+
+
+# Lazily-built keyword structures
+# ===================================================================================
+# These are forwarded to their defining module on first access so that importing
+# the package does not build them up front (PEP 562).
+_LAZY_ATTRIBUTES = {
+    "era_keywords": "era",  # All era keywords for normalization
+    "era_keywords_ar": "era",
+    "era_keywords_en": "era",
+    "IS_ERA_WORD_AR": "era",  # Era word pre-filters by language
+    "IS_ERA_WORD_EN": "era",
+    "IS_ERA_WORD_PERSIAN_AR": "era",
+    "IS_ERA_WORD_PERSIAN_EN": "era",
+    "IS_MONTH_WORD_AR": "month",  # Month word pre-filters by language
+    "IS_MONTH_WORD_EN": "month",
+    "IS_MONTH_WORD_PERSIAN_AR": "month",
+    "IS_MONTH_WORD_PERSIAN_EN": "month",
+}
+
+
+def _from_submodule(submodule, name):
+    """Return a builder reading ``name`` from ``submodule``, which builds it lazily."""
+    def build():
+        from importlib import import_module
+        return getattr(import_module(f".{submodule}", __name__), name)
+    return build
+
+
+_, __getattr__, __dir__ = _lazy_module_attributes(globals(), {
+    name: _from_submodule(submodule, name) for name, submodule in _LAZY_ATTRIBUTES.items()
+})
 
 
 # Exported functions
@@ -57,29 +113,58 @@ from .separator import indicators_keywords
 __all__ = [
     # Era normalization and keywords
     "era_keywords",  # All era keywords
+    "era_keywords_ar",  # Era keywords in Arabic script
+    "era_keywords_en",  # Era keywords in Latin script
+    "IS_ERA_WORD_AR",  # Era word pre-filters by language
+    "IS_ERA_WORD_EN",
+    "IS_ERA_WORD_PERSIAN_AR",
+    "IS_ERA_WORD_PERSIAN_EN",
     "era_standard_keywords",  # Era keywords dictionary for normalization
+    "EraRecord",  # Immutable era keyword record
 
     # Month normalization and keywords
     "months_standard_keywords",  # Standard month keywords
     "months_variations_list",  # Comprehensive month keywords list
     "months_keywords",  # All month keywords
+    "MonthRecord",  # Immutable month keyword record
+    "resolve_num_month",  # Numeric month string -> month number
+    "resolve_month_token",  # Any month spelling -> (month number, calendar) candidates
+    "IS_MONTH_WORD_AR",  # Month word pre-filters by language
+    "IS_MONTH_WORD_EN",
+    "IS_MONTH_WORD_PERSIAN_AR",
+    "IS_MONTH_WORD_PERSIAN_EN",
 
     # Weekday normalization and keywords
     "weekdays_variations_list",  # All weekday variations
     "weekdays_standard_keywords",  # Normalized weekday names
     "weekdays_keywords",  # All weekday keywords
+    "resolve_weekday_token",  # Any weekday spelling -> (day index, language) candidates
 
     # Date indicators and separators
     "indicators_keywords",  # Date component indicators
+    "INDICATORS_BY_LANG",  # Indicator entries by language
+    "INDICATORS_BY_COMPONENT",  # Indicator entries by (language, component)
+    "IS_PUNCTUATION_SEPARATOR",  # Punctuation separator pre-filter
+    "match_punctuation_separator",  # Punctuation separator at a text position
 
     # Numeric word normalization
     "numeric_words_keywords",  # numeric words
     "search_in_keywords",      # search-in keywords
+    "search_in_keywords_batch",  # search-in keywords for many tokens at once
+    "find_months",             # single-pass month finder for free text
+    "find_month",              # first month of one calendar/language in free text
+    "get_month_regex",         # compiled month alternation per calendar/language
+    "get_month_trie",          # prefix-searchable trie of month variations
+    "KeywordTrie",             # character trie for keyword lookups
+    "scan_en",                 # single-pass English month/era scanner
+    "scan_indicators",         # single-pass indicator/separator/weekday scanner
+    "get_indicator_regex",     # compiled indicator alternation per component/language
     
     # Constants
     "Language",
     "Calendar",
     "OutputFormat",
+    "EraCode",
     "CALENDAR_ALIASES",
     "PRECISION_LEVELS",
     "SUPPORTED_LANGUAGES",
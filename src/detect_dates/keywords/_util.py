@@ -0,0 +1,66 @@
+"""
+Shared helpers for the keyword modules.
+
+Created on Sun Oct 18 14:20:05 2026
+
+@author: m.lotfi
+@description: Helpers used by several keyword modules to build their keyword tables.
+"""
+import sys
+from types import MappingProxyType
+
+
+def _freeze_entry(entry):
+    """
+    Return a read-only copy of a keyword entry.
+
+    String values and keywords are interned, so the same keyword or language code
+    is one shared object across entries and equality checks on them short-circuit
+    on identity; list values become tuples.
+    """
+    frozen = {}
+    for key, value in entry.items():
+        if isinstance(value, str):
+            value = sys.intern(value)
+        elif key == "keywords":
+            value = tuple(map(sys.intern, value))
+        elif isinstance(value, list):
+            value = tuple(value)
+        frozen[key] = value
+    return MappingProxyType(frozen)
+
+
+def _lazy_module_attributes(module_globals, builders):
+    """
+    Serve module attributes that are built on first access only (PEP 562).
+
+    Parameters
+    ----------
+    module_globals : dict
+        The ``globals()`` of the module defining the attributes.
+    builders : dict
+        Attribute name -> zero-argument callable building its value.
+
+    Returns
+    -------
+    tuple
+        ``(materialize, __getattr__, __dir__)``. ``materialize(name)`` returns the
+        value of a lazy attribute, building it if needed. Each built value is cached
+        in ``module_globals``, so later lookups never reach ``__getattr__`` again.
+    """
+    module_name = module_globals["__name__"]
+
+    def materialize(name):
+        if name not in module_globals:
+            module_globals[name] = builders[name]()
+        return module_globals[name]
+
+    def __getattr__(name):
+        if name in builders:
+            return materialize(name)
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(module_globals) | set(builders))
+
+    return materialize, __getattr__, __dir__
@@ -20,6 +20,36 @@ class OutputFormat(Enum):
     FULL = "full"
     ABBREVIATED = "abbr"
 
+class EraCode(str, Enum):
+    """
+    Normalized era codes.
+
+    Members are singletons, so era records share one instance per code and
+    ``==`` comparisons between them short-circuit on identity. Being a ``str``
+    subclass, members compare equal to their plain string value, and ``str()``
+    and f-strings render that value (``"هـ"``, not ``"EraCode.AH_AR"``).
+    """
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+    # Arabic script
+    AH_AR = "هـ"
+    BH_AR = "ق.هـ"
+    CE_AR = "م"
+    BCE_AR = "ق.م"
+    SH_AR = "هـ.ش"
+    BSH_AR = "ق.هـ.ش"
+    # Latin script
+    AH = "AH"
+    BAH = "BAH"
+    CE = "CE"
+    BCE = "BCE"
+    SH = "SH"
+    BSH = "BSH"
+
+# Normalized era string -> EraCode member
+ERA_CODE_BY_VALUE = {code.value: code for code in EraCode}
+
 # Calendar system aliases for user convenience
 CALENDAR_ALIASES = {
     'solar_hijri': 'Jalali',
@@ -65,8 +95,8 @@ class ComplexityLevel(Enum):
 
 WEEKDAY_COLUMN = 'Week Day'
 
-SUPPORTED_LANGUAGES = {lang.value for lang in Language}
-SUPPORTED_CALENDARS = {cal.value for cal in Calendar}
+SUPPORTED_LANGUAGES = frozenset(lang.value for lang in Language)
+SUPPORTED_CALENDARS = frozenset(cal.value for cal in Calendar)
 DEFAULT_LANGUAGE = Language.ARABIC.value
 DEFAULT_CALENDAR = ""
 
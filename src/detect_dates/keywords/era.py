@@ -19,6 +19,13 @@ Keywords are organized by calendar system, era type (before/after), and language
 to enable accurate date parsing and normalization across different cultural contexts.
 """
 
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+from .constants import EraCode, ERA_CODE_BY_VALUE
+from ._util import _lazy_module_attributes
+
+
 # ===================================================================================
 # ERA STANDARD KEYWORDS - Quick reference mappings
 # ===================================================================================
@@ -59,7 +66,7 @@ era_keywords_dict = {
     #             "era_type": {
     #                 "name": "unique_identifier",
     #                 "description": "human_readable_description",
-    #                 "keywords": ["list", "of", "variations"], 
+    #                 "keywords": ("list", "of", "variations"), 
     #                 "normalized": "standard_form"
     #             }
     #         }
@@ -73,7 +80,7 @@ era_keywords_dict = {
             "after_hijrah": {
                 "name": "hijri_after_hijrah_arabic_standard",
                 "description": "Keywords indicating Hijri era after Hijrah in Arabic",
-                "keywords": [
+                "keywords": (
                     # Standard Hijri indicators
                     "هجري", "هجرية", "هـ", "هــ", "هـــ", "ه", 
                     # Explicit "after Hijrah" phrases
@@ -84,13 +91,13 @@ era_keywords_dict = {
                     # Prepositional forms  
                     "بالهجري", "بالهجرية", "للهجرة", "هجری", "هجري قمري", 
                     "الهجري", "من الهجرة", "من الهجره", "من هجري"
-                ],
+                ),
                 "normalized": "هـ"
             },
             "before_hijrah": {
                 "name": "hijri_before_hijrah_arabic_standard", 
                 "description": "Keywords indicating Hijri era before Hijrah in Arabic",
-                "keywords": [
+                "keywords": (
                     # Short forms with "before" indicators
                     "قبل هـ", "قبل هــ", "قبل هـــ", "قبل ه", 
                     "ق هـ", "ق هــ", "ق هـــ", "ق ه",
@@ -99,7 +106,7 @@ era_keywords_dict = {
                     "قبل هجري قمري", "قبل هجرت", 
                     # Year forms with "before" qualifier
                     "السنة الهجرية قبل", "سنة هجرية قبل"
-                ],
+                ),
                 "normalized": "ق.هـ"
             }
         },
@@ -107,7 +114,7 @@ era_keywords_dict = {
             "after_christ": {
                 "name": "gregorian_after_christ_arabic_standard",
                 "description": "Keywords indicating Gregorian era after Christ in Arabic",
-                "keywords": [
+                "keywords": (
                     # Standard Gregorian/Christian indicators
                     "ميلاديًا", "ميلاديً", "السنة الميلادية", "سنة ميلادية",
                     "ميلادية", "ميلادي", "بالميلادي", "بالميلادية", "للميلاد",
@@ -119,13 +126,13 @@ era_keywords_dict = {
                     # Explicit "after birth" phrases  
                     "بعد الميلاد", "بعد م", "بعد الميلادي", 
                     "بعد مـ", "بعد مــ", "بعد مـــ", "الميلادي"
-                ],
+                ),
                 "normalized": "م"
             },
             "before_christ": {
                 "name": "gregorian_before_christ_arabic_standard", 
                 "description": "Keywords indicating Gregorian era before Christ in Arabic",
-                "keywords": [
+                "keywords": (
                     # Explicit "before" with various forms
                     "قبل ميلاديًا", "قبل ميلاديً", "قبل الميلاد", "قبل م",
                     "قبل الميلادي", "قبل مـ", "قبل مــ", "قبل مـــ",
@@ -134,7 +141,7 @@ era_keywords_dict = {
                     "قبل الغربية", "قبل الغربي", 
                     # Abbreviated forms
                     "ق.م", "ق م", "ق.مـ", "ق مـ", "ق.مــ", "ق مــ", "ق.مـــ"
-                ],
+                ),
                 "normalized": "ق.م"
             }
         },
@@ -142,7 +149,7 @@ era_keywords_dict = {
             "after_hijrah": {
                 "name": "Jalali_after_hijrah_persian_arabic_script",
                 "description": "Keywords indicating Solar Hijri era after Hijrah in Persian/Arabic script",
-                "keywords": [
+                "keywords": (
                     # Solar/Persian year indicators
                     "السنة الشمسية", "سنة شمسية", "شمسي",
                     "بالهجري الشمسي", "بالهجرية الشمسي", "للهجرة الشمسية",
@@ -152,20 +159,20 @@ era_keywords_dict = {
                     "بعد هجري شمسي", "بعد هجرت خورشيدي", "بعد هجرت",
                     # Short forms
                     "ش", "شمسية", "شمسية هجري"
-                ],
+                ),
                 "normalized": "هـ.ش"
             },
             "before_hijrah": {
                 "name": "Jalali_before_hijrah_persian_arabic_script",
                 "description": "Keywords indicating Solar Hijri era before Hijrah in Persian/Arabic script", 
-                "keywords": [
+                "keywords": (
                     # "Before" + solar indicators
                     "قبل السنة الشمسية", "قبل سنة شمسية", "قبل شمسي",
                     "قبل الهجري الشمسي", "قبل الهجرية الشمسي", "قبل للهجرة الشمسية",
                     # Abbreviated "before" forms
                     "ق.هـ.ش", "ق ه.ش", "ق هجرية شمسية", 
                     "قبل هجرت خورشيدي", "قبل هجري شمسي"
-                ],
+                ),
                 "normalized": "ق.هـ.ش"
             }
         }
@@ -175,7 +182,7 @@ era_keywords_dict = {
             "after_hijrah": {
                 "name": "hijri_after_hijrah_english_standard",
                 "description": "Keywords indicating Hijri era after Hijrah in English",
-                "keywords": [
+                "keywords": (
                     # Standard abbreviations
                     "AH", "H", "Hijri",
                     # Latin forms
@@ -183,19 +190,19 @@ era_keywords_dict = {
                     # English phrases
                     "After Hijrah", "After Hijra", "After Hijri", 
                     "After Hegira", "After Hegiri"
-                ],
+                ),
                 "normalized": "AH"
             },
             "before_hijrah": {
                 "name": "hijri_before_hijrah_english_standard",
                 "description": "Keywords indicating Hijri era before Hijrah in English", 
-                "keywords": [
+                "keywords": (
                     # Standard abbreviations
                     "BAH", "BH",
                     # Full forms with "before" 
                     "before Anno Hegirae", "before Hijrah", "before Hijra",
                     "before Hijri", "before Hegira", "before Hegiri"
-                ],
+                ),
                 "normalized": "BAH"  # Note: Original had "BAH" but structure suggests "BH"
             }
         },
@@ -203,25 +210,25 @@ era_keywords_dict = {
             "after_christ": {
                 "name": "gregorian_after_christ_english_standard",
                 "description": "Keywords indicating Gregorian era after Christ in English",
-                "keywords": [
+                "keywords": (
                     # Standard abbreviations (secular and religious)
                     "AD", "CE", "AC", "A.D.", "C.E.", "A.C.", 
                     # Full forms
                     "Anno Domini", "Common Era", "Anno Christiani", 
                     "Christian Era", "Christian"
-                ],
+                ),
                 "normalized": "CE"  # Using secular standard
             },
             "before_christ": {
                 "name": "gregorian_before_christ_english_standard",
                 "description": "Keywords indicating Gregorian era before Christ in English",
-                "keywords": [
+                "keywords": (
                     # Standard abbreviations
                     "BC", "BCE", "B.C.", "B.C.E.", "B.CE", "B.C.E.", "B.C.E",
                     # Full forms
                     "Before Christ", "Before Common Era", 
                     "Before Christian Era", "Before Christian"
-                ],
+                ),
                 "normalized": "BCE"  # Using secular standard
             }
         },
@@ -229,26 +236,26 @@ era_keywords_dict = {
             "after_hijrah": {
                 "name": "Jalali_after_hijrah_persian_english_script",
                 "description": "Keywords indicating Solar Hijri era after Hijrah in Persian/English script",
-                "keywords": [
+                "keywords": (
                     # Standard abbreviations
                     "SH", "S.H.", "AP", "Solar",
                     # Full forms
                     "Solar Hijri", "Anno Persico", "Jalali", "Persian",
                     # Explicit "after" forms
                     "After Solar Hijri", "After Hegira Jalali"
-                ],
+                ),
                 "normalized": "SH"
             },
             "before_hijrah": {
                 "name": "Jalali_before_hijrah_persian_english_script",
                 "description": "Keywords indicating Solar Hijri era before Hijrah in Persian/English script",
-                "keywords": [
+                "keywords": (
                     # Standard abbreviations
                     "BSH", "B.SH", "B.S.H.", "B.P.", "B.Persian",
                     # Full "before" forms
                     "Before Solar Hijri", "Before Jalali", "Before Anno Persico",
                     "Before Hegira Jalali", "Before Persian"
-                ],
+                ),
                 "normalized": "BSH"
             }
         }
@@ -259,235 +266,321 @@ era_keywords_dict = {
 # ERA KEYWORDS - Flattened configuration for processing
 # ===================================================================================
 
-era_keywords = [
-    # Flattened list of era keyword configurations for efficient processing.
-    #
-    # Each entry contains:
-    # - name: Unique identifier for the keyword set
-    # - keywords: List of keyword variations to match
-    # - normalized: Standard form after normalization
-    # - description: Human-readable description
-    # - examples: Sample usage patterns
-    # - language: Language/script identifier
-    # - priority: Processing priority (higher = checked first)
-    # - era: Standard era abbreviation
-    # - calendar: Calendar system name
-    #
-    # This structure enables linear processing while maintaining rich metadata.
+@dataclass(frozen=True)
+class EraRecord:
+    """
+    Immutable era keyword configuration.
+
+    Fields mirror the keys of the flattened era configuration entries; list
+    values are stored as tuples so records can be shared and hashed safely, and
+    ``normalized`` holds the shared ``EraCode`` member for the era.
+    """
+    __slots__ = (
+        "name", "keywords", "normalized", "description", "examples",
+        "language", "priority", "era", "calendar",
+    )
+
+    name: str
+    keywords: Tuple[str, ...]
+    normalized: EraCode
+    description: str
+    examples: Tuple[str, ...]
+    language: str
+    priority: int
+    era: str
+    calendar: str
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "EraRecord":
+        """Build a record from a raw configuration dictionary."""
+        return cls(**{
+            **config,
+            "keywords": tuple(config["keywords"]),
+            "examples": tuple(config["examples"]),
+            "normalized": ERA_CODE_BY_VALUE[config["normalized"]],
+        })
+
+
+def _build_era_keywords():
+    """
+    Build the flattened tuple of era keyword records.
+
+    Called on first access of ``era_keywords`` (see ``__getattr__`` below) so that
+    importing this module only pays for ``era_keywords_dict``.
+    """
+    return tuple(EraRecord.from_dict(era_config) for era_config in _raw_era_keywords())
+
+
+def _raw_era_keywords():
+    """Return the raw era keyword configurations used to build ``EraRecord``s."""
+    return [
+        # Flattened list of era keyword configurations for efficient processing.
+        #
+        # Each entry contains:
+        # - name: Unique identifier for the keyword set
+        # - keywords: Tuple of keyword variations to match
+        # - normalized: Standard form after normalization
+        # - description: Human-readable description
+        # - examples: Sample usage patterns
+        # - language: Language/script identifier
+        # - priority: Processing priority (higher = checked first)
+        # - era: Standard era abbreviation
+        # - calendar: Calendar system name
+        #
+        # This structure enables linear processing while maintaining rich metadata.
     
-    # ===============================================================================
-    # HIJRI CALENDAR KEYWORDS
-    # ===============================================================================
-    {
-        "name": "hijri_after_hijrah_arabic_standard",
-        "keywords": era_keywords_dict["ar"]["hijri"]["after_hijrah"]["keywords"],
-        "normalized": era_keywords_dict["ar"]["hijri"]["after_hijrah"]["normalized"], 
-        "description": "Keywords indicating Hijri era after Hijrah in Arabic",
-        "examples": [
-            "1445 هـ",           # Standard short form
-            "1445 هجري",        # Common long form
-            "السنة الهجرية 1445", # Formal year reference
-            "بعد الهجرة 1445",   # Explicit "after Hijrah"
-            "1445 هجري قمري"    # Lunar Hijri specification
-        ],
-        "language": "ar",
-        "priority": 100,
-        "era": "AH", 
-        "calendar": "Hijri"
-    },
-    {
-        "name": "hijri_after_hijrah_english_standard",
-        "keywords": era_keywords_dict["en"]["hijri"]["after_hijrah"]["keywords"],
-        "normalized": era_keywords_dict["en"]["hijri"]["after_hijrah"]["normalized"],
-        "description": "Keywords indicating Hijri era after Hijrah in English", 
-        "examples": [
-            "1445 AH",              # Standard abbreviation
-            "1445 After Hijra",     # Common English form
-            "1445 Anno Hegirae",    # Latin scholarly form
-            "1445 Hijri",           # Simple adjective form
-            "After Hijrah 1445"     # Prefix form
-        ],
-        "language": "en",
-        "priority": 100,
-        "era": "AH",
-        "calendar": "Hijri"
-    },
-    {
-        "name": "hijri_before_hijrah_arabic_standard",
-        "keywords": era_keywords_dict["ar"]["hijri"]["before_hijrah"]["keywords"],
-        "normalized": era_keywords_dict["ar"]["hijri"]["before_hijrah"]["normalized"],
-        "description": "Keywords indicating Hijri era before Hijrah in Arabic",
-        "examples": [
-            "10 ق.هـ",          # Standard abbreviated form
-            "5 قبل الهجرة",     # Full "before Hijrah" phrase
-            "قبل هـ 15",        # Prefix form
-            "قبل هجري 8",       # "Before Hijri" form
-            "ق هـ 22"           # Spaced abbreviation
-        ],
-        "language": "ar", 
-        "priority": 100,
-        "era": "BAH",
-        "calendar": "Hijri"
-    },
-    {
-        "name": "hijri_before_hijrah_english_standard",
-        "keywords": era_keywords_dict["en"]["hijri"]["before_hijrah"]["keywords"],
-        "normalized": era_keywords_dict["en"]["hijri"]["before_hijrah"]["normalized"],
-        "description": "Keywords indicating Hijri era before Hijrah in English",
-        "examples": [
-            "10 BAH",             # Before After Hijrah abbreviation
-            "5 before Hijrah",    # Simple English form  
-            "before Hijra 15",    # Prefix form
-            "BAH 8",              # Abbreviation prefix
-            "BH 22"               # Short abbreviation
-        ],
-        "language": "en",
-        "priority": 100, 
-        "era": "BAH",
-        "calendar": "Hijri"
-    },
+        # ===============================================================================
+        # HIJRI CALENDAR KEYWORDS
+        # ===============================================================================
+        {
+            "name": "hijri_after_hijrah_arabic_standard",
+            "keywords": era_keywords_dict["ar"]["hijri"]["after_hijrah"]["keywords"],
+            "normalized": era_keywords_dict["ar"]["hijri"]["after_hijrah"]["normalized"], 
+            "description": "Keywords indicating Hijri era after Hijrah in Arabic",
+            "examples": (
+                "1445 هـ",           # Standard short form
+                "1445 هجري",        # Common long form
+                "السنة الهجرية 1445", # Formal year reference
+                "بعد الهجرة 1445",   # Explicit "after Hijrah"
+                "1445 هجري قمري"    # Lunar Hijri specification
+            ),
+            "language": "ar",
+            "priority": 100,
+            "era": "AH", 
+            "calendar": "Hijri"
+        },
+        {
+            "name": "hijri_after_hijrah_english_standard",
+            "keywords": era_keywords_dict["en"]["hijri"]["after_hijrah"]["keywords"],
+            "normalized": era_keywords_dict["en"]["hijri"]["after_hijrah"]["normalized"],
+            "description": "Keywords indicating Hijri era after Hijrah in English", 
+            "examples": (
+                "1445 AH",              # Standard abbreviation
+                "1445 After Hijra",     # Common English form
+                "1445 Anno Hegirae",    # Latin scholarly form
+                "1445 Hijri",           # Simple adjective form
+                "After Hijrah 1445"     # Prefix form
+            ),
+            "language": "en",
+            "priority": 100,
+            "era": "AH",
+            "calendar": "Hijri"
+        },
+        {
+            "name": "hijri_before_hijrah_arabic_standard",
+            "keywords": era_keywords_dict["ar"]["hijri"]["before_hijrah"]["keywords"],
+            "normalized": era_keywords_dict["ar"]["hijri"]["before_hijrah"]["normalized"],
+            "description": "Keywords indicating Hijri era before Hijrah in Arabic",
+            "examples": (
+                "10 ق.هـ",          # Standard abbreviated form
+                "5 قبل الهجرة",     # Full "before Hijrah" phrase
+                "قبل هـ 15",        # Prefix form
+                "قبل هجري 8",       # "Before Hijri" form
+                "ق هـ 22"           # Spaced abbreviation
+            ),
+            "language": "ar", 
+            "priority": 100,
+            "era": "BAH",
+            "calendar": "Hijri"
+        },
+        {
+            "name": "hijri_before_hijrah_english_standard",
+            "keywords": era_keywords_dict["en"]["hijri"]["before_hijrah"]["keywords"],
+            "normalized": era_keywords_dict["en"]["hijri"]["before_hijrah"]["normalized"],
+            "description": "Keywords indicating Hijri era before Hijrah in English",
+            "examples": (
+                "10 BAH",             # Before After Hijrah abbreviation
+                "5 before Hijrah",    # Simple English form  
+                "before Hijra 15",    # Prefix form
+                "BAH 8",              # Abbreviation prefix
+                "BH 22"               # Short abbreviation
+            ),
+            "language": "en",
+            "priority": 100, 
+            "era": "BAH",
+            "calendar": "Hijri"
+        },
     
-    # ===============================================================================
-    # GREGORIAN CALENDAR KEYWORDS  
-    # ===============================================================================
-    {
-        "name": "gregorian_after_christ_arabic_standard",
-        "keywords": era_keywords_dict["ar"]["gregorian"]["after_christ"]["keywords"],
-        "normalized": era_keywords_dict["ar"]["gregorian"]["after_christ"]["normalized"],
-        "description": "Keywords indicating Gregorian era after Christ in Arabic",
-        "examples": [
-            "2023 م",              # Standard short form
-            "2023 ميلادي",         # Common adjective form
-            "السنة الميلادية 2023", # Formal year reference
-            "بالميلادي 2023",       # Prepositional form
-            "2023 بعد الميلاد"      # Explicit "after birth"
-        ],
-        "language": "ar",
-        "priority": 100,
-        "era": "CE", 
-        "calendar": "Gregorian"
-    },
-    {
-        "name": "gregorian_after_christ_english_standard", 
-        "keywords": era_keywords_dict["en"]["gregorian"]["after_christ"]["keywords"],
-        "normalized": era_keywords_dict["en"]["gregorian"]["after_christ"]["normalized"],
-        "description": "Keywords indicating Gregorian era after Christ in English",
-        "examples": [
-            "2023 CE",            # Common Era (secular)
-            "2023 AD",            # Anno Domini (religious)
-            "Anno Domini 2023",   # Full Latin form
-            "Common Era 2023",    # Full secular form  
-            "2023 A.D."           # Abbreviated with periods
-        ],
-        "language": "en",
-        "priority": 100,
-        "era": "CE",
-        "calendar": "Gregorian"
-    },
-    {
-        "name": "gregorian_before_christ_arabic_standard",
-        "keywords": era_keywords_dict["ar"]["gregorian"]["before_christ"]["keywords"], 
-        "normalized": era_keywords_dict["ar"]["gregorian"]["before_christ"]["normalized"],
-        "description": "Keywords indicating Gregorian era before Christ in Arabic",
-        "examples": [
-            "100 ق.م",           # Standard abbreviated form
-            "50 قبل الميلاد",     # Full "before birth" phrase
-            "ق م 75",            # Spaced abbreviation
-            "قبل الميلادي 200",   # "Before Christian" form
-            "ق.مـ 150"           # Extended letter form
-        ],
-        "language": "ar",
-        "priority": 100,
-        "era": "BC", 
-        "calendar": "Gregorian"
-    },
-    {
-        "name": "gregorian_before_christ_english_standard",
-        "keywords": era_keywords_dict["en"]["gregorian"]["before_christ"]["keywords"],
-        "normalized": era_keywords_dict["en"]["gregorian"]["before_christ"]["normalized"], 
-        "description": "Keywords indicating Gregorian era before Christ in English",
-        "examples": [
-            "100 BCE",                # Before Common Era (secular)
-            "50 BC",                  # Before Christ (religious)
-            "Before Christ 75",       # Full prefix form
-            "B.C. 200",              # Abbreviated with periods
-            "Before Common Era 150"   # Full secular form
-        ],
-        "language": "en",
-        "priority": 100,
-        "era": "BC",
-        "calendar": "Gregorian"
-    },
+        # ===============================================================================
+        # GREGORIAN CALENDAR KEYWORDS  
+        # ===============================================================================
+        {
+            "name": "gregorian_after_christ_arabic_standard",
+            "keywords": era_keywords_dict["ar"]["gregorian"]["after_christ"]["keywords"],
+            "normalized": era_keywords_dict["ar"]["gregorian"]["after_christ"]["normalized"],
+            "description": "Keywords indicating Gregorian era after Christ in Arabic",
+            "examples": (
+                "2023 م",              # Standard short form
+                "2023 ميلادي",         # Common adjective form
+                "السنة الميلادية 2023", # Formal year reference
+                "بالميلادي 2023",       # Prepositional form
+                "2023 بعد الميلاد"      # Explicit "after birth"
+            ),
+            "language": "ar",
+            "priority": 100,
+            "era": "CE", 
+            "calendar": "Gregorian"
+        },
+        {
+            "name": "gregorian_after_christ_english_standard", 
+            "keywords": era_keywords_dict["en"]["gregorian"]["after_christ"]["keywords"],
+            "normalized": era_keywords_dict["en"]["gregorian"]["after_christ"]["normalized"],
+            "description": "Keywords indicating Gregorian era after Christ in English",
+            "examples": (
+                "2023 CE",            # Common Era (secular)
+                "2023 AD",            # Anno Domini (religious)
+                "Anno Domini 2023",   # Full Latin form
+                "Common Era 2023",    # Full secular form  
+                "2023 A.D."           # Abbreviated with periods
+            ),
+            "language": "en",
+            "priority": 100,
+            "era": "CE",
+            "calendar": "Gregorian"
+        },
+        {
+            "name": "gregorian_before_christ_arabic_standard",
+            "keywords": era_keywords_dict["ar"]["gregorian"]["before_christ"]["keywords"], 
+            "normalized": era_keywords_dict["ar"]["gregorian"]["before_christ"]["normalized"],
+            "description": "Keywords indicating Gregorian era before Christ in Arabic",
+            "examples": (
+                "100 ق.م",           # Standard abbreviated form
+                "50 قبل الميلاد",     # Full "before birth" phrase
+                "ق م 75",            # Spaced abbreviation
+                "قبل الميلادي 200",   # "Before Christian" form
+                "ق.مـ 150"           # Extended letter form
+            ),
+            "language": "ar",
+            "priority": 100,
+            "era": "BC", 
+            "calendar": "Gregorian"
+        },
+        {
+            "name": "gregorian_before_christ_english_standard",
+            "keywords": era_keywords_dict["en"]["gregorian"]["before_christ"]["keywords"],
+            "normalized": era_keywords_dict["en"]["gregorian"]["before_christ"]["normalized"], 
+            "description": "Keywords indicating Gregorian era before Christ in English",
+            "examples": (
+                "100 BCE",                # Before Common Era (secular)
+                "50 BC",                  # Before Christ (religious)
+                "Before Christ 75",       # Full prefix form
+                "B.C. 200",              # Abbreviated with periods
+                "Before Common Era 150"   # Full secular form
+            ),
+            "language": "en",
+            "priority": 100,
+            "era": "BC",
+            "calendar": "Gregorian"
+        },
     
-    # ===============================================================================  
-    # PERSIAN/SOLAR HIJRI CALENDAR KEYWORDS
-    # ===============================================================================
-    {
-        "name": "Jalali_after_hijrah_persian_arabic_script", 
-        "keywords": era_keywords_dict["ar"]["Jalali"]["after_hijrah"]["keywords"],
-        "normalized": era_keywords_dict["ar"]["Jalali"]["after_hijrah"]["normalized"],
-        "description": "Keywords indicating Solar Hijri era after Hijrah in Persian/Arabic script",
-        "examples": [
-            "1402 هـ.ش",             # Standard Solar Hijri form
-            "1402 شمسي",            # "Solar" adjective  
-            "السنة الشمسية 1402",   # "The solar year"
-            "بالهجري الشمسي 1402",  # "In solar Hijri"
-            "1402 هجري شمسي"       # "Hijri solar" form
-        ],
-        "language": "persian_ar",  # Persian in Arabic script
-        "priority": 100,
-        "era": "SH",
-        "calendar": "Jalali"  # Persian/Solar Hijri uses Jalali naming
-    },
-    {
-        "name": "Jalali_after_hijrah_persian_english_script",
-        "keywords": era_keywords_dict["en"]["Jalali"]["after_hijrah"]["keywords"],
-        "normalized": era_keywords_dict["en"]["Jalali"]["after_hijrah"]["normalized"],
-        "description": "Keywords indicating Solar Hijri era after Hijrah in Persian/English script", 
-        "examples": [
-            "1402 SH",              # Standard Solar Hijri abbreviation
-            "1402 Solar Hijri",     # Full descriptive form
-            "Jalali 1402",          # Persian calendar name
-            "Persian 1402",         # National identifier
-            "1402 S.H."            # Abbreviated with periods
-        ],
-        "language": "persian_en",  # Persian in English script
-        "priority": 100,
-        "era": "SH", 
-        "calendar": "Jalali"
-    },
-    {
-        "name": "Jalali_before_hijrah_persian_arabic_script",
-        "keywords": era_keywords_dict["ar"]["Jalali"]["before_hijrah"]["keywords"],
-        "normalized": era_keywords_dict["ar"]["Jalali"]["before_hijrah"]["normalized"],
-        "description": "Keywords indicating Solar Hijri era before Hijrah in Persian/Arabic script",
-        "examples": [
-            "10 ق.هـ.ش",            # Before Solar Hijri abbreviation
-            "5 قبل شمسي",           # "Before solar" form
-            "قبل السنة الشمسية 15", # "Before the solar year"
-            "ق هـ.ش 8",            # Spaced abbreviation
-            "قبل هجري شمسي 22"     # "Before solar Hijri"
-        ],
-        "language": "persian_ar",
-        "priority": 100,
-        "era": "BSH",
-        "calendar": "Jalali"
-    },
-    {
-        "name": "Jalali_before_hijrah_persian_english_script",
-        "keywords": era_keywords_dict["en"]["Jalali"]["before_hijrah"]["keywords"], 
-        "normalized": era_keywords_dict["en"]["Jalali"]["before_hijrah"]["normalized"],
-        "description": "Keywords indicating Solar Hijri era before Hijrah in Persian/English script",
-        "examples": [
-            "10 BSH",               # Before Solar Hijri abbreviation
-            "5 Before Solar Hijri", # Full descriptive form
-            "Before Jalali 15",     # Persian calendar name with prefix  
-            "B.SH 8",              # Abbreviated with periods
-            "Before Persian 22"     # National identifier with prefix
-        ],
-        "language": "persian_en", 
-        "priority": 100,
-        "era": "BSH",
-        "calendar": "Jalali"
-    }
-]
\ No newline at end of file
+        # ===============================================================================  
+        # PERSIAN/SOLAR HIJRI CALENDAR KEYWORDS
+        # ===============================================================================
+        {
+            "name": "Jalali_after_hijrah_persian_arabic_script", 
+            "keywords": era_keywords_dict["ar"]["Jalali"]["after_hijrah"]["keywords"],
+            "normalized": era_keywords_dict["ar"]["Jalali"]["after_hijrah"]["normalized"],
+            "description": "Keywords indicating Solar Hijri era after Hijrah in Persian/Arabic script",
+            "examples": (
+                "1402 هـ.ش",             # Standard Solar Hijri form
+                "1402 شمسي",            # "Solar" adjective  
+                "السنة الشمسية 1402",   # "The solar year"
+                "بالهجري الشمسي 1402",  # "In solar Hijri"
+                "1402 هجري شمسي"       # "Hijri solar" form
+            ),
+            "language": "persian_ar",  # Persian in Arabic script
+            "priority": 100,
+            "era": "SH",
+            "calendar": "Jalali"  # Persian/Solar Hijri uses Jalali naming
+        },
+        {
+            "name": "Jalali_after_hijrah_persian_english_script",
+            "keywords": era_keywords_dict["en"]["Jalali"]["after_hijrah"]["keywords"],
+            "normalized": era_keywords_dict["en"]["Jalali"]["after_hijrah"]["normalized"],
+            "description": "Keywords indicating Solar Hijri era after Hijrah in Persian/English script", 
+            "examples": (
+                "1402 SH",              # Standard Solar Hijri abbreviation
+                "1402 Solar Hijri",     # Full descriptive form
+                "Jalali 1402",          # Persian calendar name
+                "Persian 1402",         # National identifier
+                "1402 S.H."            # Abbreviated with periods
+            ),
+            "language": "persian_en",  # Persian in English script
+            "priority": 100,
+            "era": "SH", 
+            "calendar": "Jalali"
+        },
+        {
+            "name": "Jalali_before_hijrah_persian_arabic_script",
+            "keywords": era_keywords_dict["ar"]["Jalali"]["before_hijrah"]["keywords"],
+            "normalized": era_keywords_dict["ar"]["Jalali"]["before_hijrah"]["normalized"],
+            "description": "Keywords indicating Solar Hijri era before Hijrah in Persian/Arabic script",
+            "examples": (
+                "10 ق.هـ.ش",            # Before Solar Hijri abbreviation
+                "5 قبل شمسي",           # "Before solar" form
+                "قبل السنة الشمسية 15", # "Before the solar year"
+                "ق هـ.ش 8",            # Spaced abbreviation
+                "قبل هجري شمسي 22"     # "Before solar Hijri"
+            ),
+            "language": "persian_ar",
+            "priority": 100,
+            "era": "BSH",
+            "calendar": "Jalali"
+        },
+        {
+            "name": "Jalali_before_hijrah_persian_english_script",
+            "keywords": era_keywords_dict["en"]["Jalali"]["before_hijrah"]["keywords"], 
+            "normalized": era_keywords_dict["en"]["Jalali"]["before_hijrah"]["normalized"],
+            "description": "Keywords indicating Solar Hijri era before Hijrah in Persian/English script",
+            "examples": (
+                "10 BSH",               # Before Solar Hijri abbreviation
+                "5 Before Solar Hijri", # Full descriptive form
+                "Before Jalali 15",     # Persian calendar name with prefix  
+                "B.SH 8",              # Abbreviated with periods
+                "Before Persian 22"     # National identifier with prefix
+            ),
+            "language": "persian_en", 
+            "priority": 100,
+            "era": "BSH",
+            "calendar": "Jalali"
+        }
+    ]
+
+
+def _build_era_keywords_for(lang):
+    """Return the era keyword records whose language ends with ``lang``."""
+    return tuple(
+        era_record for era_record in _materialize("era_keywords")
+        if era_record.language.endswith(lang)
+    )
+
+
+def _build_era_word_set(language):
+    """Return the lowercased keywords of every era record in exactly ``language``."""
+    return frozenset(
+        keyword.lower()
+        for era_record in _materialize("era_keywords")
+        if era_record.language == language
+        for keyword in era_record.keywords
+    )
+
+
+# ===================================================================================
+# LAZY MATERIALIZATION (PEP 562)
+# ===================================================================================
+
+# Builders for module attributes that are constructed on first access only.
+# Each built value is cached in the module globals, so later lookups never
+# reach ``__getattr__`` again.
+_LAZY_BUILDERS = {
+    "era_keywords": _build_era_keywords,
+    "era_keywords_ar": lambda: _build_era_keywords_for("ar"),
+    "era_keywords_en": lambda: _build_era_keywords_for("en"),
+    # Pre-filters answering "is this (lowercased) token any era word?"
+    "IS_ERA_WORD_AR": lambda: _build_era_word_set("ar"),
+    "IS_ERA_WORD_EN": lambda: _build_era_word_set("en"),
+    "IS_ERA_WORD_PERSIAN_AR": lambda: _build_era_word_set("persian_ar"),
+    "IS_ERA_WORD_PERSIAN_EN": lambda: _build_era_word_set("persian_en"),
+}
+
+_materialize, __getattr__, __dir__ = _lazy_module_attributes(globals(), _LAZY_BUILDERS)
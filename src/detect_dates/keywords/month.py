@@ -9,11 +9,68 @@ Created on Fri Jul 25 23:01:21 2025
     It handles both flat and nested structures, extracting and normalizing components like year, month, day, era, and weekday.
 """
 
+import logging
+import sys
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+from ._util import _lazy_module_attributes
+
+logger = logging.getLogger(__name__)
+
+# Numeric month lookup tables
+# ===================================================================================
+# Zero-padded month numbers ("01".."12"), interned once and shared by every table below
+_NUM_STRS = tuple(sys.intern(f"{i:02d}") for i in range(1, 13))
+
+# "01" -> 1, ..., "12" -> 12
+_NUM_TO_INT = {num: i for i, num in enumerate(_NUM_STRS, start=1)}
+
+# 1 -> "01", ..., 12 -> "12" (index 0 is unused so month numbers index directly)
+_INT_TO_NUM = (None,) + _NUM_STRS
+
+
+def resolve_num_month(token):
+    """
+    Resolve a numeric month string to its month number (1-12).
+
+    Zero-padded tokens ("01".."12") are answered from a lookup table; other
+    digit strings ("1".."12") fall back to ``int()`` parsing.
+
+    Parameters
+    ----------
+    token : str
+        Numeric month token.
+
+    Returns
+    -------
+    int or None
+        Month number between 1 and 12, or None if ``token`` is not a valid month.
+
+    Examples
+    --------
+    >>> resolve_num_month("03")
+    3
+    >>> resolve_num_month("11")
+    11
+    >>> resolve_num_month("13") is None
+    True
+    """
+    month = _NUM_TO_INT.get(token)
+    if month is None and token.isdecimal():
+        month = int(token)
+        if not 1 <= month <= 12:
+            return None
+    return month
+
+
 # Standard keywords for month names
 # ===================================================================================
 months_standard_keywords = {
     # Numeric representations (01-12)
-    "num": ["01", "02", "03", "04", "05", "06", "07", "08", "09", "10", "11", "12"],
+    "num": _NUM_STRS,
         
     # Gregorian calendar - Arabic variations
     "gregorian_ar": ["يناير", "فبراير", "مارس", "أبريل", "مايو", "يونيو", "يوليو", "أغسطس", "سبتمبر", "أكتوبر", "نوفمبر", "ديسمبر"],
@@ -43,7 +100,7 @@ months_standard_keywords = {
 months_variations_list = {
         # Numeric representations (1-12 and 01-12)
         "num1": ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12"],
-        "num2": ["01", "02", "03", "04", "05", "06", "07", "08", "09", "10", "11", "12"],
+        "num2": _NUM_STRS,
         
         # Gregorian calendar - Arabic variations
         "gregorian_ar": ["يناير", "فبراير", "مارس", "أبريل", "مايو", "يونيو", "يوليو", "أغسطس", "سبتمبر", "أكتوبر", "نوفمبر", "ديسمبر"],
@@ -97,189 +154,322 @@ months_variations_list = {
     }
 
 
-# Initialize calendar system collections
-# Gregorian months - Western calendar (365-366 days/year)
-months_gregorian_en = []
-months_gregorian_ar = []
+# Drop variation lists that are identical to an earlier one (e.g. the repeated
+# "gregorian_ar_mixed*" and "persian_ar*" lists). The first key is kept, so
+# first-match lookups resolve exactly as before.
+_first_key_by_names = {}
+for key, value in months_variations_list.items():
+    _first_key_by_names.setdefault(tuple(value), key)
+_duplicate_keys = [
+    key for key, value in months_variations_list.items()
+    if _first_key_by_names[tuple(value)] != key
+]
+if _duplicate_keys:
+    logger.debug("Dropping duplicate month variation lists: %s", _duplicate_keys)
+months_variations_list = {
+    key: value for key, value in months_variations_list.items()
+    if key not in _duplicate_keys
+}
+del _first_key_by_names, _duplicate_keys
 
-# Hijri months - Islamic lunar calendar (354-355 days/year, 29-30 days each)
-months_hijri_en = []
-months_hijri_ar = []
 
-# Persian/Jalali months - Iranian solar calendar (365-366 days/year, first 6 months 31 days, next 5 months 30 days, last month 29-30 days)
-months_Jalali_en = []
-months_Jalali_ar = []
+# ===================================================================================
+# MONTH INDEX - Every spelling resolved with a single dict lookup
+# ===================================================================================
+@lru_cache(maxsize=None)
+def _build_month_index():
+    """
+    Map every month spelling to its ``(month_number, calendar)`` candidates.
 
-# Process month name variations and categorize by calendar system
-for key, value in months_variations_list.items():    
-    # Handle English Gregorian month variations
-    if key.startswith("gregorian_en"):
-        months_gregorian_en = months_gregorian_en + months_variations_list[key]
-        
-    # Handle English Hijri month variations
-    elif key.startswith("hijri_en"):
-        months_hijri_en = months_hijri_en + months_variations_list[key]
-        
-    # Handle English Persian month variations  
-    elif key.startswith("persian_en"):
-        months_Jalali_en = months_Jalali_en + months_variations_list[key]
-        
-    # Handle Arabic Gregorian month variations (including Levantine)
-    elif key.startswith("gregorian_ar"):
-        months_gregorian_ar = months_gregorian_ar + months_variations_list[key]
-        
-    # Handle Arabic Hijri month variations
-    elif key.startswith("hijri_ar"):
-        months_hijri_ar = months_hijri_ar + months_variations_list[key]
-        
-    # Handle Persian/Farsi month variations
-    elif key.startswith("persian_ar"):
-        months_Jalali_ar = months_Jalali_ar + months_variations_list[key]
-        
-# Remove duplicates using set() - order doesn't matter for month name matching
-months_gregorian_en = list(set(months_gregorian_en))
-months_gregorian_ar = list(set(months_gregorian_ar))
-months_hijri_en = list(set(months_hijri_en))
-months_hijri_ar = list(set(months_hijri_ar))
-months_Jalali_en = list(set(months_Jalali_en))
-months_Jalali_ar = list(set(months_Jalali_ar))
-
-months_keywords = [
-    # ===================================================================================
-    # GREGORIAN CALENDAR MONTHS - Multiple language variants
-    # ===================================================================================
-    {
-        "name": "gregorian_months_english_full",  # Original: months_gregorian_en
-        "keywords": months_gregorian_en,  
-        "description": "Full English Gregorian month names",
-        "examples": [  # Original: example (single string) - Fixed to examples list
-            "January",
-            "February",
-            "March",
-            "April",
-            "May",
-            "June",
-            "July",
-            "August",
-            "September",
-            "October",
-            "November",
-            "December"
-        ],
-        "language": "en",
-        "priority": 100,  # Highest priority for English Gregorian months
-        "component": "month",
-        "calendar": "Gregorian"
-    },
-    {
-        "name": "gregorian_months_arabic_standard",  # Original: months_gregorian_ar
-        "keywords": months_gregorian_ar,  
-        "description": "Standard Arabic Gregorian month names",
-        "examples": [  # Original: example (single string) - Fixed to examples list
-            "يناير",      # January
-            "فبراير",     # February
-            "مارس",       # March
-            "أبريل",      # April
-            "مايو",       # May
-            "يونيو",      # June
-            "يوليو",      # July
-            "أغسطس",      # August
-            "سبتمبر",     # September
-            "أكتوبر",     # October
-            "نوفمبر",     # November
-            "ديسمبر"      # December
-        ],
-        "language": "ar",
-        "priority": 100,  # Highest priority for Arabic Gregorian months
-        "component": "month",
-        "calendar": "Gregorian"
-    },
+    Keys are casefolded, and an NFKC-normalized form is added for spellings
+    that have one (Arabic presentation forms, compatibility characters).
+    Values are tuples because a spelling may be shared by several calendars.
+    Built on the first lookup, not at import.
+    """
+    month_index = {}
+    for key, names in months_variations_list.items():
+        calendar = "num" if key.startswith("num") else key.split("_", 1)[0]
+        for month_num, name in enumerate(names, start=1):
+            candidate = (month_num, calendar)
+            spellings = {name.casefold(), unicodedata.normalize("NFKC", name).casefold()}
+            for spelling in spellings:
+                candidates = month_index.get(spelling, ())
+                if candidate not in candidates:
+                    month_index[spelling] = candidates + (candidate,)
+    return month_index
+
+
+
+def resolve_month_token(token):
+    """
+    Resolve a month token to its ``(month_number, calendar)`` candidates.
+
+    Parameters
+    ----------
+    token : str
+        Month name, abbreviation or number in any supported spelling.
+
+    Returns
+    -------
+    tuple of (int, str)
+        Matching ``(month_number, calendar)`` pairs, empty if unknown.
+
+    Examples
+    --------
+    >>> resolve_month_token("May")
+    ((5, 'gregorian'),)
+    >>> resolve_month_token("رمضان")
+    ((9, 'hijri'),)
+    """
+    return _build_month_index().get(token.strip().casefold(), ())
+
+
+# Month name variations grouped by calendar system and script
+# ===================================================================================
+# "<calendar>_<lang>" prefix of months_variations_list keys -> collection it feeds
+#   gregorian: Western calendar (365-366 days/year)
+#   hijri:     Islamic lunar calendar (354-355 days/year, 29-30 days each)
+#   persian:   Iranian solar calendar (365-366 days/year, first 6 months 31 days,
+#              next 5 months 30 days, last month 29-30 days)
+_BUCKET_BY_PREFIX = {
+    "gregorian_en": "gregorian_en",
+    "hijri_en": "hijri_en",
+    "persian_en": "Jalali_en",
+    "gregorian_ar": "gregorian_ar",  # includes Levantine and mixed variants
+    "hijri_ar": "hijri_ar",
+    "persian_ar": "Jalali_ar",
+}
+
+
+def _variation_prefix(key):
+    """Return the "<calendar>_<lang>" prefix of a variation key ("hijri_ar1" -> "hijri_ar")."""
+    calendar, _, rest = key.partition("_")
+    return f"{calendar}_{rest.split('_', 1)[0].rstrip('0123456789')}"
+
+
+# One pass over the variations, collecting normalized (lowercased, stripped) names
+# into a set per collection so duplicates are dropped as they are added. Names are
+# interned, so every collection (and the search index) shares one object per
+# distinct spelling instead of keeping a normalized copy of every list.
+_month_buckets = {bucket: set() for bucket in _BUCKET_BY_PREFIX.values()}
+for key, value in months_variations_list.items():
+    bucket = _BUCKET_BY_PREFIX.get(_variation_prefix(key))
+    if bucket is not None:
+        _month_buckets[bucket].update(sys.intern(mon.lower().strip()) for mon in value)
+
+# Materialize each collection once as a read-only tuple, sorted so that iteration
+# order (and anything built from it) is deterministic across runs
+months_gregorian_en = tuple(sorted(_month_buckets["gregorian_en"]))
+months_gregorian_ar = tuple(sorted(_month_buckets["gregorian_ar"]))
+months_hijri_en = tuple(sorted(_month_buckets["hijri_en"]))
+months_hijri_ar = tuple(sorted(_month_buckets["hijri_ar"]))
+months_Jalali_en = tuple(sorted(_month_buckets["Jalali_en"]))
+months_Jalali_ar = tuple(sorted(_month_buckets["Jalali_ar"]))
+del _month_buckets
+
+
+@dataclass(frozen=True)
+class MonthRecord:
+    """
+    Immutable month keyword configuration.
+
+    Fields mirror the keys of the month configuration entries; list values are
+    stored as tuples so records can be shared and hashed safely.
+    """
+    __slots__ = (
+        "name", "keywords", "description", "examples",
+        "language", "priority", "component", "calendar",
+    )
+
+    name: str
+    keywords: Tuple[str, ...]
+    description: str
+    examples: Tuple[str, ...]
+    language: str
+    priority: int
+    component: str
+    calendar: str
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "MonthRecord":
+        """Build a record from a raw configuration dictionary."""
+        return cls(**{
+            **config,
+            "keywords": tuple(config["keywords"]),
+            "examples": tuple(config["examples"]),
+        })
+
+
+# Month keyword records, built from the raw configuration tuple below
+months_keywords = tuple(MonthRecord.from_dict(month_config) for month_config in (
+        # ===================================================================================
+        # GREGORIAN CALENDAR MONTHS - Multiple language variants
+        # ===================================================================================
+        {
+            "name": "gregorian_months_english_full",  # Original: months_gregorian_en
+            "keywords": months_gregorian_en,  
+            "description": "Full English Gregorian month names",
+            "examples": [  # Original: example (single string) - Fixed to examples list
+                "January",
+                "February",
+                "March",
+                "April",
+                "May",
+                "June",
+                "July",
+                "August",
+                "September",
+                "October",
+                "November",
+                "December"
+            ],
+            "language": "en",
+            "priority": 100,  # Highest priority for English Gregorian months
+            "component": "month",
+            "calendar": "Gregorian"
+        },
+        {
+            "name": "gregorian_months_arabic_standard",  # Original: months_gregorian_ar
+            "keywords": months_gregorian_ar,  
+            "description": "Standard Arabic Gregorian month names",
+            "examples": [  # Original: example (single string) - Fixed to examples list
+                "يناير",      # January
+                "فبراير",     # February
+                "مارس",       # March
+                "أبريل",      # April
+                "مايو",       # May
+                "يونيو",      # June
+                "يوليو",      # July
+                "أغسطس",      # August
+                "سبتمبر",     # September
+                "أكتوبر",     # October
+                "نوفمبر",     # November
+                "ديسمبر"      # December
+            ],
+            "language": "ar",
+            "priority": 100,  # Highest priority for Arabic Gregorian months
+            "component": "month",
+            "calendar": "Gregorian"
+        },
     
-    # ===================================================================================
-    # HIJRI CALENDAR MONTHS - Islamic lunar calendar
-    # ===================================================================================
-    {
-        "name": "hijri_months_arabic_standard",  # Original: months_hijri_ar
-        "keywords": months_hijri_ar,  
-        "description": "Standard Arabic Hijri (Islamic) month names",
-        "examples": [  # Original: example (single string) - Fixed to examples list
-            "محرم",            # Muharram
-            "صفر",             # Safar
-            "ربيع الأول",       # Rabi' al-awwal
-            "ربيع الثاني",      # Rabi' al-thani
-            "جمادى الأولى",     # Jumada al-awwal
-            "جمادى الآخرة",     # Jumada al-thani
-            "رجب",             # Rajab
-            "شعبان",           # Sha'ban
-            "رمضان",           # Ramadan
-            "شوال",            # Shawwal
-            "ذو القعدة",       # Dhu al-Qi'dah
-            "ذو الحجة"         # Dhu al-Hijjah
-        ],
-        "language": "ar",
-        "priority": 100,  # Highest priority for Arabic Hijri months
-        "component": "month",
-        "calendar": "Hijri"
-    },
-    {
-        "name" : "hijri_months_english_standard",
-        "keywords": months_hijri_en,  
-        "description": "Standard Arabic Hijri (Islamic) month names",
-        "examples": [""],
-        "language": "en",
-        "priority": 100,  # Highest priority for Arabic Hijri months
-        "component": "month",
-        "calendar": "Hijri"
-    },
+        # ===================================================================================
+        # HIJRI CALENDAR MONTHS - Islamic lunar calendar
+        # ===================================================================================
+        {
+            "name": "hijri_months_arabic_standard",  # Original: months_hijri_ar
+            "keywords": months_hijri_ar,  
+            "description": "Standard Arabic Hijri (Islamic) month names",
+            "examples": [  # Original: example (single string) - Fixed to examples list
+                "محرم",            # Muharram
+                "صفر",             # Safar
+                "ربيع الأول",       # Rabi' al-awwal
+                "ربيع الثاني",      # Rabi' al-thani
+                "جمادى الأولى",     # Jumada al-awwal
+                "جمادى الآخرة",     # Jumada al-thani
+                "رجب",             # Rajab
+                "شعبان",           # Sha'ban
+                "رمضان",           # Ramadan
+                "شوال",            # Shawwal
+                "ذو القعدة",       # Dhu al-Qi'dah
+                "ذو الحجة"         # Dhu al-Hijjah
+            ],
+            "language": "ar",
+            "priority": 100,  # Highest priority for Arabic Hijri months
+            "component": "month",
+            "calendar": "Hijri"
+        },
+        {
+            "name" : "hijri_months_english_standard",
+            "keywords": months_hijri_en,  
+            "description": "Standard Arabic Hijri (Islamic) month names",
+            "examples": [""],
+            "language": "en",
+            "priority": 100,  # Highest priority for Arabic Hijri months
+            "component": "month",
+            "calendar": "Hijri"
+        },
     
-    # ===================================================================================
-    # Jalali/PERSIAN CALENDAR MONTHS - Solar Hijri calendar
-    # ===================================================================================
-    {
-        "name": "Jalali_months_persian_arabic_script",  # Original: months_Jalali_ar
-        "keywords": months_Jalali_ar,  
-        "description": "Persian Solar Hijri month names in Arabic script",
-        "examples": [  # Original: example (single string) - Fixed to examples list
-            "فروردین",    # Farvardin
-            "اردیبهشت",   # Ordibehesht
-            "خرداد",      # Khordad
-            "تیر",        # Tir
-            "مرداد",      # Mordad
-            "شهریور",     # Shahrivar
-            "مهر",        # Mehr
-            "آبان",       # Aban
-            "آذر",        # Azar
-            "دی",         # Dey
-            "بهمن",       # Bahman
-            "اسفند"       # Esfand
-        ],
-        "language": "persian_ar",
-        "priority": 100,  # Highest priority for Persian in Arabic script
-        "component": "month",
-        "calendar": "Jalali"
-    },
+        # ===================================================================================
+        # Jalali/PERSIAN CALENDAR MONTHS - Solar Hijri calendar
+        # ===================================================================================
+        {
+            "name": "Jalali_months_persian_arabic_script",  # Original: months_Jalali_ar
+            "keywords": months_Jalali_ar,  
+            "description": "Persian Solar Hijri month names in Arabic script",
+            "examples": [  # Original: example (single string) - Fixed to examples list
+                "فروردین",    # Farvardin
+                "اردیبهشت",   # Ordibehesht
+                "خرداد",      # Khordad
+                "تیر",        # Tir
+                "مرداد",      # Mordad
+                "شهریور",     # Shahrivar
+                "مهر",        # Mehr
+                "آبان",       # Aban
+                "آذر",        # Azar
+                "دی",         # Dey
+                "بهمن",       # Bahman
+                "اسفند"       # Esfand
+            ],
+            "language": "persian_ar",
+            "priority": 100,  # Highest priority for Persian in Arabic script
+            "component": "month",
+            "calendar": "Jalali"
+        },
     
-    {
-        "name": "Jalali_months_persian_latin_script",  # Original: months_Jalali_en
-        "keywords": months_Jalali_en,  
-        "description": "Persian Solar Hijri month names in Latin script",
-        "examples": [  # Original: example (single string) - Fixed to examples list
-            "farvardin",     # Spring month 1
-            "ordibehesht",   # Spring month 2
-            "khordad",       # Spring month 3
-            "tir",           # Summer month 1
-            "mordad",        # Summer month 2
-            "shahrivar",     # Summer month 3
-            "mehr",          # Autumn month 1
-            "aban",          # Autumn month 2
-            "azar",          # Autumn month 3
-            "dey",           # Winter month 1
-            "bahman",        # Winter month 2
-            "esfand"         # Winter month 3
-        ],
-        "language": "persian_en",
-        "priority": 100,  # Highest priority for Persian in Latin script
-        "component": "month",
-        "calendar": "Jalali"
-    }
-]
\ No newline at end of file
+        {
+            "name": "Jalali_months_persian_latin_script",  # Original: months_Jalali_en
+            "keywords": months_Jalali_en,  
+            "description": "Persian Solar Hijri month names in Latin script",
+            "examples": [  # Original: example (single string) - Fixed to examples list
+                "farvardin",     # Spring month 1
+                "ordibehesht",   # Spring month 2
+                "khordad",       # Spring month 3
+                "tir",           # Summer month 1
+                "mordad",        # Summer month 2
+                "shahrivar",     # Summer month 3
+                "mehr",          # Autumn month 1
+                "aban",          # Autumn month 2
+                "azar",          # Autumn month 3
+                "dey",           # Winter month 1
+                "bahman",        # Winter month 2
+                "esfand"         # Winter month 3
+            ],
+            "language": "persian_en",
+            "priority": 100,  # Highest priority for Persian in Latin script
+            "component": "month",
+            "calendar": "Jalali"
+        },
+    ))
+
+# Highest priority first, so first-match consumers try preferred entries first.
+# sorted() is stable, so entries of equal priority keep their declaration order.
+months_keywords = tuple(
+    sorted(months_keywords, key=lambda month_record: -month_record.priority)
+)
+
+
+# ===================================================================================
+# MONTH WORD PRE-FILTERS - "Is this (lowercased) token any month word?"
+# ===================================================================================
+def _build_month_word_set(language):
+    """Return the lowercased keywords of every month entry in exactly ``language``."""
+    return frozenset(
+        keyword.lower()
+        for month_record in months_keywords
+        if month_record.language == language
+        for keyword in month_record.keywords
+    )
+
+
+# Lazily-built module attributes (PEP 562)
+# ===================================================================================
+# The pre-filters are only built on first access and then cached in the module
+# namespace, so importing this module does not pay for them up front.
+_LAZY_BUILDERS = {
+    "IS_MONTH_WORD_AR": lambda: _build_month_word_set("ar"),
+    "IS_MONTH_WORD_EN": lambda: _build_month_word_set("en"),
+    "IS_MONTH_WORD_PERSIAN_AR": lambda: _build_month_word_set("persian_ar"),
+    "IS_MONTH_WORD_PERSIAN_EN": lambda: _build_month_word_set("persian_en"),
+}
+
+_, __getattr__, __dir__ = _lazy_module_attributes(globals(), _LAZY_BUILDERS)
@@ -0,0 +1,323 @@
+"""
+Multi-pattern keyword scanner.
+
+Created on Sun Oct 18 09:12:40 2026
+
+@author: m.lotfi
+@description: Scan free text for every English month and era keyword, or every date
+indicator, separator and weekday keyword, in a single pass, and compile per-language
+indicator alternations.
+
+Each keyword union is compiled once, on first use, into the fastest backend available:
+
+- Hyperscan (``pip install hyperscan``): SIMD-accelerated multi-pattern DFA.
+- pyahocorasick (``pip install pyahocorasick``): Aho-Corasick automaton.
+- A single compiled ``re`` alternation, always available.
+"""
+import re
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple
+
+from .month import months_keywords
+from .separator import indicators_keywords
+from .trie import KeywordTrie
+from .weekday import weekdays_keywords
+
+
+_WORD_CHAR = re.compile(r"\w")
+
+
+def _is_word_bounded(text: str, start: int, end: int) -> bool:
+    """
+    Return False if ``text[start:end]`` is embedded in a longer word.
+
+    Mirrors ``KeywordTrie.to_regex(word_boundaries=True)``: a match that starts
+    (ends) with a word character must not be preceded (followed) by another one.
+    """
+    if start > 0 and _WORD_CHAR.match(text, start) and _WORD_CHAR.match(text, start - 1):
+        return False
+    if end < len(text) and _WORD_CHAR.match(text, end - 1) and _WORD_CHAR.match(text, end):
+        return False
+    return True
+
+
+def _select_matches(
+    text: str, candidates: List[Tuple[int, int, int]]
+) -> List[Tuple[int, int, int]]:
+    """
+    Reduce overlapping ``(start, end, keyword_id)`` candidates to the ``re`` result.
+
+    Keeps the word-bounded candidates that are leftmost, then longest, and do not
+    overlap an earlier kept one, which is what ``finditer`` over a word-bounded
+    trie alternation reports.
+    """
+    selected = []
+    last_end = 0
+    for start, end, keyword_id in sorted(candidates, key=lambda match: (match[0], -match[1])):
+        if start >= last_end and _is_word_bounded(text, start, end):
+            selected.append((start, end, keyword_id))
+            last_end = end
+    return selected
+
+
+def _compile_keywords(keywords: Tuple[str, ...]):
+    """
+    Compile lowercase, unique keywords with the best available backend.
+
+    Returns ``(backend, matcher)``; every backend reports a match by its index
+    into ``keywords``. The optional accelerators are imported here, on the first
+    scan, so importing the package does not load them.
+    """
+    try:
+        import hyperscan
+    except ImportError:  # optional accelerator
+        pass
+    else:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[re.escape(keyword).encode("utf-8") for keyword in keywords],
+            ids=list(range(len(keywords))),
+            elements=len(keywords),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(keywords),
+        )
+        return "hyperscan", database
+
+    try:
+        import ahocorasick
+    except ImportError:  # optional accelerator
+        pass
+    else:
+        automaton = ahocorasick.Automaton()
+        for keyword_id, keyword in enumerate(keywords):
+            automaton.add_word(keyword, (keyword_id, len(keyword)))
+        automaton.make_automaton()
+        return "ahocorasick", automaton
+
+    # Prefix-factored, word-bounded alternation; it prefers the fullest match at
+    # each position, so it needs no further selection
+    trie = KeywordTrie((keyword, None) for keyword in keywords)
+    pattern = re.compile(trie.to_regex(word_boundaries=True), re.IGNORECASE)
+    return "re", (pattern, {keyword: keyword_id for keyword_id, keyword in enumerate(keywords)})
+
+
+def _lower_keeping_offsets(text: str) -> str:
+    """
+    Lowercase ``text`` without changing its length, so match offsets stay valid.
+
+    The few characters whose lowercase is longer ("İ" -> "i̇") are left as they are.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+
+def _char_offsets(data: bytes, byte_offsets) -> Dict[int, int]:
+    """
+    Map UTF-8 byte offsets into ``data`` to character offsets.
+
+    Only the given offsets are converted: they are visited in order and the
+    bytes between two of them are decoded once, so the cost follows the number
+    of matches rather than a Python step per character of the text.
+    """
+    offsets = {}
+    previous_byte = previous_char = 0
+    for byte_offset in sorted(set(byte_offsets)):
+        previous_char += len(data[previous_byte:byte_offset].decode("utf-8"))
+        previous_byte = byte_offset
+        offsets[byte_offset] = previous_char
+    return offsets
+
+
+def _scan_keywords(backend: str, matcher, text: str) -> List[Tuple[int, int, int]]:
+    """
+    Return the ``(start, end, keyword_id)`` matches of a compiled keyword set.
+
+    Matches are word-bounded, non-overlapping and leftmost-longest on every
+    backend, in order of appearance.
+    """
+    if backend == "re":
+        pattern, keyword_ids = matcher
+        return [(match.start(), match.end(), keyword_ids[match.group().lower()])
+                for match in pattern.finditer(text)]
+
+    candidates = []
+    if backend == "hyperscan":
+        data = text.encode("utf-8")
+
+        def _on_hyperscan_match(keyword_id, start, end, flags, context):
+            candidates.append((start, end, keyword_id))
+
+        matcher.scan(data, match_event_handler=_on_hyperscan_match)
+        if candidates and len(data) != len(text):
+            # Hyperscan reports byte offsets; convert them to character offsets
+            offsets = _char_offsets(
+                data, [offset for start, end, _ in candidates for offset in (start, end)]
+            )
+            candidates = [(offsets[start], offsets[end], keyword_id)
+                          for start, end, keyword_id in candidates]
+    else:
+        for end_idx, (keyword_id, length) in matcher.iter(_lower_keeping_offsets(text)):
+            candidates.append((end_idx - length + 1, end_idx + 1, keyword_id))
+    return _select_matches(text, candidates)
+
+
+def _en_scan_groups() -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """Return ``(name, keywords)`` for every English month and era keyword set."""
+    # Imported here so the lazily-built era records are only built when scanning
+    from . import era
+
+    groups = [
+        (month_record.name, month_record.keywords)
+        for month_record in months_keywords
+        if month_record.language.endswith("en")
+    ]
+    groups.extend(
+        (era_record.name, era_record.keywords)
+        for era_record in era.era_keywords
+        if era_record.language.endswith("en")
+    )
+    return tuple(groups)
+
+
+@lru_cache(maxsize=None)
+def _build_en_scanner():
+    """
+    Compile the English keyword union with the best available backend.
+
+    A keyword listed by several sets is tagged with the first set listing it.
+    """
+    owners = {}
+    for name, keywords in _en_scan_groups():
+        for keyword in keywords:
+            owners.setdefault(keyword.lower(), name)
+    backend, matcher = _compile_keywords(tuple(owners))
+    return backend, matcher, tuple(owners.values())
+
+
+def scan_en(text: str, on_match: Callable[[str, int, int], None]) -> None:
+    """
+    Scan text for every English month and era keyword in one pass.
+
+    Parameters
+    ----------
+    text : str
+        Text to scan.
+    on_match : Callable[[str, int, int], None]
+        Called as ``on_match(name, start, end)`` for each match, in order of
+        appearance, where ``name`` is the keyword set name (e.g.
+        ``"gregorian_months_english_full"``) and ``text[start:end]`` is the
+        matched keyword.
+
+    Notes
+    -----
+    Keywords never match inside a longer word ("may" does not match "mayor"), and
+    overlapping matches resolve to the longest one ("March", not "Mar"). Every
+    backend reports the same matches.
+
+    Examples
+    --------
+    >>> found = []
+    >>> scan_en("15 March 1990 AD", lambda name, start, end: found.append(name))
+    >>> found
+    ['gregorian_months_english_full', 'gregorian_after_christ_english_standard']
+    """
+    backend, matcher, names = _build_en_scanner()
+    for start, end, keyword_id in _scan_keywords(backend, matcher, text):
+        on_match(names[keyword_id], start, end)
+
+
+@lru_cache(maxsize=None)
+def _build_indicator_scanner():
+    """
+    Compile every indicator, separator and weekday keyword into one matcher.
+
+    A keyword listed by several entries (e.g. "-" is both a separator and a range
+    connector) is tagged with its highest-priority owner. Whitespace separators
+    are left out: they would report every gap between two words.
+    """
+    owners = {}
+    entries = sorted(
+        (*indicators_keywords, *weekdays_keywords), key=lambda entry: -entry["priority"]
+    )
+    for entry in entries:
+        for keyword in entry["keywords"]:
+            if keyword.strip():
+                owners.setdefault(keyword.lower(), (entry["name"], entry["priority"]))
+    backend, matcher = _compile_keywords(tuple(owners))
+    return backend, matcher, tuple(owners.values())
+
+
+def scan_indicators(text: str) -> List[Tuple[int, str, int]]:
+    """
+    Scan text for every date indicator, separator and weekday keyword in one pass.
+
+    Parameters
+    ----------
+    text : str
+        Text to scan.
+
+    Returns
+    -------
+    List[Tuple[int, str, int]]
+        ``(end, name, priority)`` for each match, in order of appearance, where
+        ``end`` is the exclusive end offset of the keyword in ``text`` and
+        ``name``/``priority`` come from the keyword entry (e.g.
+        ``"range_connectors_english"``, ``80``).
+
+    Notes
+    -----
+    Word keywords never match inside a longer word ("in" does not match "during",
+    "th" does not match "the"), overlapping matches resolve to the longest one
+    ("from the" over "from"), and the whitespace separator is not reported.
+    Every backend reports the same matches.
+
+    Examples
+    --------
+    >>> scan_indicators("circa 1445")
+    [(5, 'approximation_indicators_english', 70)]
+    """
+    backend, matcher, tags = _build_indicator_scanner()
+    return [(end, *tags[keyword_id]) for _, end, keyword_id in _scan_keywords(backend, matcher, text)]
+
+
+@lru_cache(maxsize=None)
+def get_indicator_regex(component: str, lang: str) -> "re.Pattern":
+    """
+    Return the compiled keyword alternation for one indicator component and language.
+
+    Covers ``indicators_keywords`` and ``weekdays_keywords`` (component ``"day"``).
+    Keywords are factored by shared prefix (see ``KeywordTrie.to_regex``), the
+    alternation prefers the longest keyword ("from the" over "from"), and word
+    keywords never match inside a longer word ("in" does not match "during").
+    Patterns are compiled on first use and cached.
+
+    Parameters
+    ----------
+    component : str
+        Entry component, e.g. ``"range_connector_indicator"``, ``"temporal_indicator"``
+        or ``"day"``.
+    lang : str
+        Language code ('ar', 'en', 'persian_ar', 'persian_en'); entries whose
+        language ends with it are included.
+
+    Raises
+    ------
+    KeyError
+        If no entry has this component and language.
+
+    Examples
+    --------
+    >>> get_indicator_regex("range_starter_indicator", "en").search("from the 1990s").group()
+    'from the'
+    """
+    keywords = {
+        keyword
+        for entry in (*indicators_keywords, *weekdays_keywords)
+        if entry["component"] == component and entry["language"].endswith(lang)
+        for keyword in entry["keywords"]
+    }
+    if not keywords:
+        raise KeyError((component, lang))
+    trie = KeywordTrie((keyword.lower(), None) for keyword in keywords)
+    return re.compile(trie.to_regex(word_boundaries=True), re.IGNORECASE)
@@ -7,7 +7,111 @@ Created on Thu Jul 24 20:01:16 2025
 @author: m.lotfi
 @description: Utility functions for searching month names within keyword dictionaries.
 """
-from typing import Union, Tuple, Dict, Optional
+import re
+import sys
+from functools import lru_cache
+from typing import Union, Tuple, Dict, Iterable, Iterator, List, Optional
+
+from .month import (
+    months_variations_list,
+    months_gregorian_ar,
+    months_gregorian_en,
+    months_hijri_ar,
+    months_hijri_en,
+    months_Jalali_ar,
+    months_Jalali_en,
+)
+from .scan import _compile_keywords, _scan_keywords
+from .trie import KeywordTrie
+
+__all__ = [
+    "search_in_keywords",
+    "search_in_keywords_batch",
+    "find_months",
+    "find_month",
+    "get_month_regex",
+    "get_month_trie",
+]
+
+# Deduplicated, normalized month names per (calendar, language)
+_MONTH_COLLECTIONS = {
+    ("gregorian", "ar"): months_gregorian_ar,
+    ("gregorian", "en"): months_gregorian_en,
+    ("hijri", "ar"): months_hijri_ar,
+    ("hijri", "en"): months_hijri_en,
+    ("Jalali", "ar"): months_Jalali_ar,
+    ("Jalali", "en"): months_Jalali_en,
+}
+
+
+# Arabic letters that are commonly written interchangeably, folded to one spelling:
+# hamza/madda alef forms -> bare alef, taa marbuta -> haa, alef maqsura and Farsi
+# yeh -> yeh, keheh -> kaf. Tatweel (U+0640) and harakat (tanwin, short vowels,
+# shadda and sukun, U+064B-U+0652) are optional in writing and are removed.
+_ARABIC_FOLD = str.maketrans({
+    "أ": "ا",
+    "إ": "ا",
+    "آ": "ا",
+    "ة": "ه",
+    "ى": "ي",
+    "ی": "ي",
+    "ک": "ك",
+    "\u0640": None,
+    **dict.fromkeys(map(chr, range(0x064B, 0x0653)), None),
+})
+
+
+# Reverse-lookup indexes keyed by id() of the keywords dictionary they were built from.
+# The dictionary is stored next to its index so a recycled id() is never mistaken for it.
+# At most _INDEX_CACHE_SIZE indexes are kept; the oldest one is evicted first.
+_INDEX_CACHE: Dict[int, Tuple[Dict[str, list], Dict[str, Tuple[str, int]]]] = {}
+_INDEX_CACHE_SIZE = 32
+
+
+def _build_index(keywords: Dict[str, list]) -> Dict[str, Tuple[str, int]]:
+    """
+    Map every normalized keyword to the first ``(key, index)`` it appears at.
+
+    Keys and lists are visited in dictionary order, so the index reproduces the
+    first-match semantics of a linear scan. Normalized keywords are interned so
+    they share storage with the other pre-normalized keyword tables.
+
+    Every keyword is also indexed under its Arabic-folded spelling (see
+    ``_ARABIC_FOLD``), added after all exact spellings so an exact match always
+    wins over a folded one.
+    """
+    index = {}
+    for key, value in keywords.items():
+        for idx, mon in enumerate(value):
+            index.setdefault(sys.intern(mon.lower().strip()), (key, idx))
+    for variant, hit in list(index.items()):
+        index.setdefault(sys.intern(variant.translate(_ARABIC_FOLD)), hit)
+    return index
+
+
+@lru_cache(maxsize=None)
+def _month_variation_index() -> Dict[str, Tuple[str, int]]:
+    """
+    Return the reverse-lookup index of ``months_variations_list``.
+
+    The month vocabulary is static and is by far the most searched dictionary,
+    so its index is built once and returned without going through the
+    ``id()``-keyed cache and its eviction logic.
+    """
+    return _build_index(months_variations_list)
+
+
+def _get_index(keywords: Dict[str, list]) -> Dict[str, Tuple[str, int]]:
+    """Return the cached reverse-lookup index for ``keywords``, building it once."""
+    if keywords is months_variations_list:
+        return _month_variation_index()
+    cached = _INDEX_CACHE.get(id(keywords))
+    if cached is None or cached[0] is not keywords:
+        _INDEX_CACHE.pop(id(keywords), None)
+        if len(_INDEX_CACHE) >= _INDEX_CACHE_SIZE:
+            del _INDEX_CACHE[next(iter(_INDEX_CACHE))]
+        cached = _INDEX_CACHE[id(keywords)] = (keywords, _build_index(keywords))
+    return cached[1]
 
 
 def search_in_keywords(search_month: str, keywords: Dict[str, list]) -> Tuple[Optional[str], Optional[int]]:
@@ -17,6 +121,13 @@ def search_in_keywords(search_month: str, keywords: Dict[str, list]) -> Tuple[Op
     This function performs a case-insensitive search across all lists in the keywords
     dictionary and returns the first match found along with its position.
 
+    The normalized keywords of each dictionary are indexed on first use, so every
+    later search is a single hash lookup. Keyword dictionaries are expected to be
+    module-level constants that are not mutated after their first search.
+
+    Arabic spellings that differ only in hamza/alef, taa marbuta or yeh forms,
+    tatweel or diacritics (e.g. "إبريل", "ابريل" and "إبريـل") match each other.
+
     Parameters
     ----------
     search_month : str
@@ -44,17 +155,194 @@ def search_in_keywords(search_month: str, keywords: Dict[str, list]) -> Tuple[Op
     >>> search_in_keywords('nonexistent', keywords)
     (None, None)
     """
-    # Normalize the search term once for efficiency
-    normalized_search = search_month.lower().strip()
-    
-    for key, value in keywords.items():
-        # Create normalized version of the current list for comparison
-        search_list = [mon.lower().strip() for mon in value]
+    normalized = search_month.lower().strip()
+    if not normalized:
+        return None, None
+    index = _get_index(keywords)
+    if normalized[0].isdigit():
+        # Numeric tokens have no Arabic letters to fold
+        return index.get(normalized, (None, None))
+    normalized = sys.intern(normalized)
+    hit = index.get(normalized) or index.get(normalized.translate(_ARABIC_FOLD))
+    return hit if hit else (None, None)
+
+
+def search_in_keywords_batch(
+    search_months: Iterable[str], keywords: Dict[str, list]
+) -> List[Tuple[Optional[str], Optional[int]]]:
+    """
+    Search for many month names at once.
+
+    Equivalent to ``[search_in_keywords(m, keywords) for m in search_months]`` but
+    fetches the reverse-lookup index once and binds the lookup outside the loop,
+    which removes the per-call overhead when classifying large token streams.
+
+    Parameters
+    ----------
+    search_months : Iterable[str]
+        Month names to search for.
+    keywords : Dict[str, list]
+        Dictionary where keys are category names and values are lists of month names
+
+    Returns
+    -------
+    List[Tuple[Optional[str], Optional[int]]]
+        One ``(matching_key, index)`` pair per input, ``(None, None)`` for misses.
+
+    Examples
+    --------
+    >>> search_in_keywords_batch(['Jan', 'xyz'], {'en': ['jan', 'feb']})
+    [('en', 0), (None, None)]
+    """
+    lookup = _get_index(keywords).get
+    miss = (None, None)
+    results = []
+    for month in search_months:
+        normalized = month.lower().strip()
+        results.append(
+            lookup(normalized) or lookup(normalized.translate(_ARABIC_FOLD), miss)
+        )
+    return results
+
+
+@lru_cache(maxsize=None)
+def _build_month_matcher():
+    """
+    Compile every month name variation into a single matcher.
 
-        if normalized_search in search_list:
-            # Find the index of the matching month
-            idx = search_list.index(normalized_search)
-            return key, idx
+    Uses the same backends as ``scan_en`` (Hyperscan, pyahocorasick, then one
+    compiled ``re`` alternation), imported on first use. Numeric variations are
+    left out, since bare digits are not month names in free text.
 
-    # Return None values if no match is found
-    return None, None
\ No newline at end of file
+    Returns ``(backend, matcher, hits)``, where ``hits[keyword_id]`` is the
+    ``(key, index)`` of the matched variation.
+    """
+    index = {
+        variant: hit for variant, hit in _get_index(months_variations_list).items()
+        if variant and not hit[0].startswith("num")
+    }
+    backend, matcher = _compile_keywords(tuple(index))
+    return backend, matcher, tuple(index.values())
+
+
+def find_months(text: str) -> Iterator[Tuple[int, str, int]]:
+    """
+    Find every month name in free text in a single pass.
+
+    Parameters
+    ----------
+    text : str
+        Text to scan.
+
+    Yields
+    ------
+    Tuple[int, str, int]
+        ``(end_pos, key, index)`` for each month found, in order of appearance,
+        where ``text[:end_pos]`` ends with the month name, ``key`` is the
+        ``months_variations_list`` key it belongs to and ``index`` is its
+        zero-based month position.
+
+    Notes
+    -----
+    Matches must not be embedded in a longer word, and overlapping matches
+    resolve to the longest one ("مارس/آذار", not "مارس"). Every backend reports
+    the same matches.
+
+    Examples
+    --------
+    >>> list(find_months("15 March 1990"))
+    [(8, 'gregorian_en', 2)]
+    """
+    backend, matcher, hits = _build_month_matcher()
+    for _, end, keyword_id in _scan_keywords(backend, matcher, text):
+        key, idx = hits[keyword_id]
+        yield end, key, idx
+
+
+@lru_cache(maxsize=None)
+def get_month_regex(calendar: str, lang: str) -> "re.Pattern":
+    """
+    Return the compiled month alternation for one calendar and language.
+
+    Names are factored by shared prefix (see ``KeywordTrie.to_regex``) and the
+    alternation always prefers the fullest match ("كانون الأول" before "كانون");
+    names must not be embedded in a longer word.
+    Patterns are compiled on first use and cached.
+
+    Parameters
+    ----------
+    calendar : str
+        Calendar system ('gregorian', 'hijri', 'Jalali').
+    lang : str
+        Language code ('ar', 'en').
+
+    Raises
+    ------
+    KeyError
+        If the calendar/language combination is not supported.
+    """
+    trie = KeywordTrie((name, None) for name in _MONTH_COLLECTIONS[(calendar, lang)])
+    return re.compile(r"(?<!\w)(?:" + trie.to_regex() + r")(?!\w)", re.IGNORECASE)
+
+
+def find_month(text: str, calendar: str, lang: str) -> Optional[Tuple[str, int]]:
+    """
+    Find the first month name of one calendar and language in free text.
+
+    Parameters
+    ----------
+    text : str
+        Text to scan.
+    calendar : str
+        Calendar system ('gregorian', 'hijri', 'Jalali').
+    lang : str
+        Language code ('ar', 'en').
+
+    Returns
+    -------
+    Optional[Tuple[str, int]]
+        ``(matched_text, index)`` with the zero-based month index, or None.
+
+    Examples
+    --------
+    >>> find_month("15 March 1990", "gregorian", "en")
+    ('March', 2)
+    >>> find_month("١ كانون الأول ٢٠٢٠", "gregorian", "ar")
+    ('كانون الأول', 11)
+    """
+    match = get_month_regex(calendar, lang).search(text)
+    if match is None:
+        return None
+    _, idx = _get_index(months_variations_list)[match.group().lower()]
+    return match.group(), idx
+
+
+@lru_cache(maxsize=None)
+def get_month_trie() -> KeywordTrie:
+    """
+    Return a trie of every normalized month name variation, built on first use.
+
+    Each keyword maps to ``(calendar, language, index)``, where ``calendar`` is
+    ``"num"`` for numeric variations (with ``language`` None) and ``index`` is the
+    zero-based month position. Use ``trie.get`` for exact matches,
+    ``trie.longest_prefix_item`` to disambiguate prefixes (``"rab"`` vs ``"rabi"``)
+    and ``trie.items(prefix)`` for starts-with matching.
+
+    Examples
+    --------
+    >>> get_month_trie().get("jan")
+    ('gregorian', 'en', 0)
+    >>> get_month_trie().longest_prefix_item("ramadan 1445")
+    ('ramadan', ('hijri', 'en', 8))
+    """
+    trie = KeywordTrie()
+    for variant, (key, idx) in _get_index(months_variations_list).items():
+        if not variant:
+            continue
+        parts = key.split("_")
+        if parts[0].startswith("num"):
+            trie[variant] = ("num", None, idx)
+        else:
+            # "gregorian_en2" -> ("gregorian", "en")
+            trie[variant] = (parts[0], parts[1].rstrip("0123456789"), idx)
+    return trie
@@ -6,7 +6,7 @@ Created on Sun Jun 22 21:38:10 2025
 
 @description: This module provides calendar conversion utilities and functions to get calendar variants.
 '''
-
+from ._util import _freeze_entry
 
 
 # ===================================================================================
@@ -15,31 +15,31 @@ Created on Sun Jun 22 21:38:10 2025
 # ===================================================================================
 
 # Year indicators - words that typically precede or follow year numbers
-year_keywords_ar = [
+year_keywords_ar = (
     "سنة", "عام", "في عام", "في سنة", "خلال عام", "خلال سنة",
     "في السنة", "خلال السنة", "في العام", "خلال العام",
     "في هذه السنة", "خلال هذه السنة", "في هذا العام", "خلال هذا العام",
     "سال",  # Persian loanword commonly used in Arabic
     "عام الـ", "السنة الـ", "سنة الـ"  # Added common prefixes
-]
+)
 
-year_keywords_en = [
+year_keywords_en = (
     "year", "in year", "during year", "in the year", "during the year",
     "this year", "that year", "the year", "year of", "the year of",
     "in", "during", "by year"  # Added common English patterns
-]
+)
 
 # Day and month indicators - contextual words
-day_indicators_keywords = [
+day_indicators_keywords = (
     "يوم", "اليوم", "اليوم الموافق", "في يوم", "بيوم", "يوم الـ"
-]
-month_indicators_keywords = [
+)
+month_indicators_keywords = (
     "شهر", "الشهر", "الشهر الموافق", "في شهر", "بشهر", "شهر الـ"
-]
+)
 
 # Century indicators - for historical date ranges
-century_keywords_ar = ["القرن", "في القرن", "خلال القرن", "قرن", "القرن الـ"]
-century_keywords_en = ["century", "in century", "during century", "the century", "century of"]
+century_keywords_ar = ("القرن", "في القرن", "خلال القرن", "قرن", "القرن الـ")
+century_keywords_en = ("century", "in century", "during century", "the century", "century of")
 
 date_indicators_keywords = [
     # ===================================================================================
@@ -157,20 +157,58 @@ date_indicators_keywords = [
     },
 ]
 
+# Freeze the entries: read-only mappings with interned strings and tuple values
+date_indicators_keywords = tuple(_freeze_entry(entry) for entry in date_indicators_keywords)
+
 
 # ===================================================================================
 # DATE SEPARATORS AND CONNECTORS
 # ===================================================================================
 # Punctuation and linguistic connectors used in date expressions
-punctuation_separators = [
+punctuation_separators = (
     # Punctuation separators
     "/", "-", ".", " ", ":", "\\", "|", "–", "—", "=", "_", ",", ";",
     # Universal punctuation separators
     "~", "→", "←", ">>", "<<"
-]
+)
+
+# "Is this token a punctuation separator?" - O(1) membership
+IS_PUNCTUATION_SEPARATOR = frozenset(punctuation_separators)
+
+# Punctuation separators partitioned by length: single characters are answered
+# with one set probe, and only characters that start a multi-character separator
+# (">>", "<<") fall through to a prefix comparison, longest first
+_SEPARATOR_CHARS = frozenset(sep for sep in punctuation_separators if len(sep) == 1)
+_SEPARATOR_SEQUENCES = tuple(sorted(
+    (sep for sep in punctuation_separators if len(sep) > 1), key=len, reverse=True
+))
+_SEPARATOR_SEQUENCE_STARTS = frozenset(sep[0] for sep in _SEPARATOR_SEQUENCES)
+
+
+def match_punctuation_separator(text, pos=0):
+    """
+    Return the punctuation separator starting at ``text[pos]``, or None.
+
+    Multi-character separators win over single characters at the same position.
+
+    Examples
+    --------
+    >>> match_punctuation_separator("2023/12/25", 4)
+    '/'
+    >>> match_punctuation_separator("a >> b", 2)
+    '>>'
+    >>> match_punctuation_separator("2023", 0) is None
+    True
+    """
+    char = text[pos:pos + 1]
+    if char in _SEPARATOR_SEQUENCE_STARTS:
+        for sep in _SEPARATOR_SEQUENCES:
+            if text.startswith(sep, pos):
+                return sep
+    return char if char in _SEPARATOR_CHARS else None
 
 # Arabic date connectors
-connectors_separators_ar = [
+connectors_separators_ar = (
     # Arabic date connectors
     "الموافق", "موافق", "الموافق لـ", "- الموافق",
 
@@ -179,92 +217,86 @@ connectors_separators_ar = [
 
     # Arabic starting point indicators
     "من", "منذ", "ابتداء من", "بداية من", "اعتبارا من",
-]
+)
 
 # English date connectors
-connectors_separators_en = [
+connectors_separators_en = (
     "corresponding to", "equiv.", "equivalent to", "matching", "equal to"
-]
+)
+
+# Symbol range connectors, shared by every language (all are also punctuation separators)
+range_connectors_symbols = ("-", "–", "—", "/", ":", "~")
 
 # Arabic range connectors
-range_connectors_ar = [
-    "-", "–", "—", "/", ":", "~",
-    "الى", "إلى", "حتى", "وحتى", "لغاية", "إلى غاية"]
+range_connectors_ar = (
+    *range_connectors_symbols,
+    "الى", "إلى", "حتى", "وحتى", "لغاية", "إلى غاية")
 # English range connectors
-range_connectors_en = [
-    "-", "–", "—", "/", ":", "~",
+range_connectors_en = (
+    *range_connectors_symbols,
     "to", "until", "through", "thru", "till", "up to",
     "up until", "through to", "and", "&", "between", "from"
-]
+)
 
 # Arabic range starters
-range_starters_ar = [
+range_starters_ar = (
     "من", "منذ", "ابتداء من", "بداية من", "اعتبارا من", "اعتباراً من"
-]
+)
 # English range starters
-range_starters_en = [
+range_starters_en = (
     "from", "since", "starting from", "beginning from", "as of", "as from",
     "commencing", "starting", "beginning", "from the", "since the"
-]
+)
 
 # Arabic approximation indicators
-approximation_ar = [
+approximation_ar = (
     "حوالي", "نحو", "تقريباً", "تقريبا", "قريب من", "حول", "في حدود", "قرابة", "نحو"
-]
+)
 
 # English approximation indicators
-approximation_en = [
+approximation_en = (
     "about", "around", "approximately", "circa", "ca.", "c.", "roughly",
     "near", "nearly", "close to", "some", "somewhere around", "in the region of",
     "in the vicinity of", "more or less", "give or take", "thereabouts"
-]
+)
 
 # Arabic temporal indicators
-temporal_ar = [
+temporal_ar = (
     "قبل", "بعد", "منذ", "حتى", "عند", "في", "خلال", "أثناء"
-]
+)
 
 # English temporal indicators
-temporal_en = [
+temporal_en = (
     "before", "after", "since", "until", "at", "in", "during", "while",
     "throughout", "within", "by", "on", "over", "across", "through",
     "amid", "amidst", "for", "upon", "under"
-]
+)
+
+# Shared template of the per-language punctuation separator entries
+_DATE_SEPARATORS_STANDARD = {
+    "keywords": punctuation_separators,
+    "description": "Standard separators and connectors used in date expressions",
+    "examples": (
+        "2023/12/25",           # Slash separator
+        "من 2020 إلى 2023",     # Range with Arabic connectors
+        "1445-01-15",           # Dash separator
+        "الموافق 25 ديسمبر"     # Arabic date connector
+    ),
+    "priority": 50,            # Lower priority than specific indicators
+    "component": "separator_indicator",
+    "calendar": "universal"
+}
 
 separators_indicators_keywords = [
     # ===================================================================================
     # SEPARATOR INDICATORS - Punctuation and connectors
     # ===================================================================================
-    {
-        "name": "date_separators_standard_ar",
-        "keywords": punctuation_separators,
-        "description": "Standard separators and connectors used in date expressions",
-        "examples": [
-            "2023/12/25",           # Slash separator
-            "من 2020 إلى 2023",     # Range with Arabic connectors
-            "1445-01-15",           # Dash separator
-            "الموافق 25 ديسمبر"     # Arabic date connector
-        ],
-        "language": "ar",        # Both Arabic and universal symbols
-        "priority": 50,            # Lower priority than specific indicators
-        "component": "separator_indicator",
-        "calendar": "universal"
-    },
-    {
-        "name": "date_separators_standard_en",
-        "keywords": punctuation_separators,
-        "description": "Standard separators and connectors used in date expressions",
-        "examples": [
-            "2023/12/25",           # Slash separator
-            "من 2020 إلى 2023",     # Range with Arabic connectors
-            "1445-01-15",           # Dash separator
-            "الموافق 25 ديسمبر"     # Arabic date connector
-        ],
-        "language": "en",        # Both Arabic and universal symbols
-        "priority": 50,            # Lower priority than specific indicators
-        "component": "separator_indicator",
-        "calendar": "universal"
-    },
+    # Punctuation is language-independent: one entry per language, all sharing the
+    # same keyword tuple and template (see _DATE_SEPARATORS_STANDARD)
+    *(
+        {"name": f"date_separators_standard_{lang}", **_DATE_SEPARATORS_STANDARD, "language": lang}
+        for lang in ("ar", "en")
+    ),
     {
         "name": "connectors_separators_ar",
         "keywords": connectors_separators_ar,
@@ -431,7 +463,23 @@ separators_indicators_keywords = [
     }
 ]
 
+# Freeze the entries: read-only mappings with interned strings and tuple values
+separators_indicators_keywords = tuple(_freeze_entry(entry) for entry in separators_indicators_keywords)
+
 # ===================================================================================
 # STRUCTURED INDICATORS DATA
 # ===================================================================================
-indicators_keywords = date_indicators_keywords + separators_indicators_keywords
\ No newline at end of file
+indicators_keywords = date_indicators_keywords + separators_indicators_keywords
+
+# Pre-filtered views, built once so callers look entries up instead of
+# re-filtering indicators_keywords on every parse
+_by_lang, _by_component = {}, {}
+for entry in indicators_keywords:
+    _by_lang.setdefault(entry["language"], []).append(entry)
+    _by_component.setdefault((entry["language"], entry["component"]), []).append(entry)
+
+# language -> entries, e.g. INDICATORS_BY_LANG["en"]
+INDICATORS_BY_LANG = {lang: tuple(entries) for lang, entries in _by_lang.items()}
+# (language, component) -> entries, e.g. INDICATORS_BY_COMPONENT[("ar", "year_indicator")]
+INDICATORS_BY_COMPONENT = {key: tuple(entries) for key, entries in _by_component.items()}
+del _by_lang, _by_component, entry
@@ -0,0 +1,176 @@
+"""
+Keyword trie.
+
+Created on Sun Oct 18 10:05:12 2026
+
+@author: m.lotfi
+@description: A character trie for exact, longest-prefix and starts-with keyword lookups,
+    and for emitting prefix-factored regex alternations.
+"""
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Node key holding a terminal value; never a single character, so it cannot
+# collide with a child edge.
+_VALUE = ""
+
+_WORD_CHAR = re.compile(r"\w")
+
+
+class KeywordTrie:
+    """
+    Character trie mapping keywords to values.
+
+    Lookups cost O(len(query)) independently of the number of stored keywords.
+    Keywords are stored exactly as given, so callers normalize them (and the
+    queries) the same way, e.g. with ``str.lower().strip()``.
+
+    Parameters
+    ----------
+    items : Iterable[Tuple[str, Any]], optional
+        Initial ``(keyword, value)`` pairs.
+
+    Examples
+    --------
+    >>> trie = KeywordTrie([("jan", 0), ("january", 0), ("jun", 5)])
+    >>> trie.get("jun")
+    5
+    >>> trie.longest_prefix_item("january 2024")
+    ('january', 0)
+    >>> trie.items("ja")
+    [('jan', 0), ('january', 0)]
+    """
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, items: Optional[Iterable[Tuple[str, Any]]] = None):
+        self._root: Dict[str, Any] = {}
+        self._size = 0
+        for keyword, value in items or ():
+            self[keyword] = value
+
+    def __setitem__(self, keyword: str, value: Any) -> None:
+        node = self._root
+        for char in keyword:
+            node = node.setdefault(char, {})
+        if _VALUE not in node:
+            self._size += 1
+        node[_VALUE] = value
+
+    def _find_node(self, prefix: str) -> Optional[Dict[str, Any]]:
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+    def get(self, keyword: str, default: Any = None) -> Any:
+        """Return the value stored for ``keyword``, or ``default``."""
+        node = self._find_node(keyword)
+        if node is None:
+            return default
+        return node.get(_VALUE, default)
+
+    def __contains__(self, keyword: str) -> bool:
+        node = self._find_node(keyword)
+        return node is not None and _VALUE in node
+
+    def __len__(self) -> int:
+        return self._size
+
+    def longest_prefix_item(
+        self, text: str, default: Tuple[Optional[str], Any] = (None, None)
+    ) -> Tuple[Optional[str], Any]:
+        """
+        Return the longest stored keyword that ``text`` starts with.
+
+        Returns
+        -------
+        Tuple[Optional[str], Any]
+            ``(keyword, value)`` of the longest match, or ``default`` if none.
+        """
+        node = self._root
+        best = default
+        for end, char in enumerate(text, start=1):
+            node = node.get(char)
+            if node is None:
+                break
+            if _VALUE in node:
+                best = (text[:end], node[_VALUE])
+        if _VALUE in self._root and best is default:
+            return "", self._root[_VALUE]
+        return best
+
+    def items(self, prefix: str = "") -> List[Tuple[str, Any]]:
+        """Return every ``(keyword, value)`` whose keyword starts with ``prefix``."""
+        node = self._find_node(prefix)
+        if node is None:
+            return []
+        found = []
+        stack = [(prefix, node)]
+        while stack:
+            keyword, node = stack.pop()
+            if _VALUE in node:
+                found.append((keyword, node[_VALUE]))
+            # Push children in reverse so they pop in sorted order
+            for char in sorted((c for c in node if c != _VALUE), reverse=True):
+                stack.append((keyword + char, node[char]))
+        return found
+
+    def to_regex(self, word_boundaries: bool = False) -> str:
+        """
+        Return a prefix-factored regex alternation matching every stored keyword.
+
+        Shared prefixes are emitted once (``from(?:\\ the)?`` rather than
+        ``from\\ the|from``) and sibling single-character leaves collapse into a
+        character class, so the compiled pattern has far fewer branches to try.
+        Longer keywords are always tried before their prefixes, so a match is the
+        longest stored keyword at its position.
+
+        Parameters
+        ----------
+        word_boundaries : bool, optional
+            If True, keywords starting (ending) with a word character do not match
+            right after (before) another word character, so "in" does not match
+            inside "during". Keywords edged by punctuation are unaffected.
+
+        Examples
+        --------
+        >>> KeywordTrie([("from", 0), ("from the", 0), ("since", 0)]).to_regex()
+        'from(?:\\\\ the)?|since'
+        """
+        branches = []
+        for char in sorted(c for c in self._root if c != _VALUE):
+            branch = re.escape(char) + _node_regex(self._root[char], char, word_boundaries)
+            if word_boundaries and _WORD_CHAR.match(char):
+                branch = r"(?<!\w)" + branch
+            branches.append(branch)
+        return "|".join(branches)
+
+
+def _node_regex(node: Dict[str, Any], last_char: str, word_boundaries: bool) -> str:
+    """Return the regex for the keyword suffixes below ``node`` (reached via ``last_char``)."""
+    branches, leaf_chars = [], []
+    for char in sorted(c for c in node if c != _VALUE):
+        suffix = _node_regex(node[char], char, word_boundaries)
+        if suffix:
+            branches.append(re.escape(char) + suffix)
+        else:
+            leaf_chars.append(char)
+    if len(leaf_chars) == 1:
+        branches.append(re.escape(leaf_chars[0]))
+    elif leaf_chars:
+        branches.append("[" + "".join(re.escape(c) for c in leaf_chars) + "]")
+
+    if _VALUE not in node:
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    # A keyword ends here; its continuations are tried first so longer keywords win
+    end = r"(?!\w)" if word_boundaries and _WORD_CHAR.match(last_char) else ""
+    if not branches:
+        return end
+    if end:
+        return "(?:" + "|".join(branches + [end]) + ")"
+    return "(?:" + "|".join(branches) + ")?"
@@ -5,6 +5,11 @@ Created on Sun Jun 22 21:38:10 2025
 @author: m.lotfi
 @description: This module provides weekday name extraction and normalization utilities.
 '''
+import sys
+from functools import lru_cache
+
+from ._util import _freeze_entry
+
 
 # Weekday name extraction system
 # Supports multiple languages and transliterations
@@ -46,39 +51,88 @@ weekdays_variations_list = {
 }
 
 
-# Initialize weekday collections by language
-# English weekday variations
-weekdays_en = []
-# Farsi to English transliterations
-weekdays_fa_en = []
-# Arabic weekday variations
-weekdays_ar = []
-# Farsi/Persian weekday variations
-weekdays_fa_ar = []
-
-# Process weekday variations and categorize by language
+# ===================================================================================
+# WEEKDAY INDEX - Every spelling resolved with a single dict lookup
+# ===================================================================================
+# weekdays_variations_list key prefix -> language code used by weekdays_keywords
+_LANGUAGE_BY_PREFIX = (
+    ("num", "num"),
+    ("weekdays_fa_en", "persian_en"),
+    ("weekdays_fa_ar", "persian_ar"),
+    ("weekdays_en", "en"),
+    ("weekdays_ar", "ar"),
+)
+
+
+@lru_cache(maxsize=None)
+def _build_weekday_index():
+    """
+    Map every casefolded weekday spelling to its ``(day_index, language)`` candidates.
+
+    ``day_index`` is 0 for Sunday through 6 for Saturday. Values are tuples because
+    a spelling may be listed under several languages. Built on the first lookup,
+    not at import.
+    """
+    weekday_index = {}
+    for key, names in weekdays_variations_list.items():
+        language = next(lang for prefix, lang in _LANGUAGE_BY_PREFIX if key.startswith(prefix))
+        for day_index, name in enumerate(names):
+            candidate = (day_index, language)
+            spelling = sys.intern(name.casefold())
+            candidates = weekday_index.get(spelling, ())
+            if candidate not in candidates:
+                weekday_index[spelling] = candidates + (candidate,)
+    return weekday_index
+
+
+def resolve_weekday_token(token):
+    """
+    Resolve a weekday token to its ``(day_index, language)`` candidates.
+
+    Parameters
+    ----------
+    token : str
+        Weekday name, abbreviation or number in any supported spelling.
+
+    Returns
+    -------
+    tuple of (int, str)
+        Matching ``(day_index, language)`` pairs (0 = Sunday), empty if unknown.
+
+    Examples
+    --------
+    >>> resolve_weekday_token("Friday")
+    ((5, 'en'),)
+    >>> resolve_weekday_token("الجمعة")
+    ((5, 'ar'),)
+    """
+    return _build_weekday_index().get(token.strip().casefold(), ())
+
+
+# Weekday collections by language, keyed by the weekdays_variations_list key prefix
+# that feeds them. Longer prefixes come first so each key lands in exactly one bucket.
+_BUCKET_PREFIXES = (
+    "weekdays_fa_en",  # Farsi to English transliterations
+    "weekdays_fa_ar",  # Farsi/Persian weekday variations (in Arabic script)
+    "weekdays_en",     # English weekday variations
+    "weekdays_ar",     # Arabic weekday variations
+)
+
+# One pass over the variations; each value is extended into its bucket once
+_weekday_buckets = {prefix: [] for prefix in _BUCKET_PREFIXES}
 for key, value in weekdays_variations_list.items():
-    # Handle English weekday variations
-    if key.startswith("weekdays_en"):
-        weekdays_en = weekdays_en + weekdays_variations_list[key]
-
-    # Handle Farsi to English transliterations
-    elif key.startswith("weekdays_fa_en"):
-        weekdays_fa_en = weekdays_fa_en + weekdays_variations_list[key]
-
-    # Handle Arabic weekday variations
-    elif key.startswith("weekdays_ar"):
-        weekdays_ar = weekdays_ar + weekdays_variations_list[key]
-
-    # Handle Farsi weekday variations (in Arabic script)
-    elif key.startswith("weekdays_fa_ar"):
-        weekdays_fa_ar = weekdays_fa_ar + weekdays_variations_list[key]
-
-# Remove duplicates using set() - order doesn't matter for weekday name matching
-weekdays_en     = list(set(weekdays_en))
-weekdays_fa_en  = list(set(weekdays_fa_en))
-weekdays_ar     = list(set(weekdays_ar))
-weekdays_fa_ar  = list(set(weekdays_fa_ar))
+    for prefix in _BUCKET_PREFIXES:
+        if key.startswith(prefix):
+            _weekday_buckets[prefix].extend(value)
+            break
+
+# Remove duplicates while keeping first-seen order, so the collections (and the
+# patterns built from them) are identical on every run
+weekdays_en     = tuple(dict.fromkeys(_weekday_buckets["weekdays_en"]))
+weekdays_fa_en  = tuple(dict.fromkeys(_weekday_buckets["weekdays_fa_en"]))
+weekdays_ar     = tuple(dict.fromkeys(_weekday_buckets["weekdays_ar"]))
+weekdays_fa_ar  = tuple(dict.fromkeys(_weekday_buckets["weekdays_fa_ar"]))
+del _weekday_buckets
 
 # Complete weekdays keywords structure
 weekdays_keywords = [
@@ -97,7 +151,8 @@ weekdays_keywords = [
         "language": "en",
         "priority": 100,  # Highest priority for comprehensive English weekdays
         "component": "day",
-        "calendar": "Numeric"  # Weekdays are calendar-independent
+        "calendar": "Numeric",  # Weekdays are calendar-independent
+        "calendars": ("Numeric", "Gregorian"),  # Calendars these names are used with
     },
 
     {
@@ -116,7 +171,8 @@ weekdays_keywords = [
         "language": "ar",
         "priority": 100,  # Highest priority for standard Arabic
         "component": "day",
-        "calendar": "Numeric"  # Weekdays are calendar-independent
+        "calendar": "Numeric",  # Weekdays are calendar-independent
+        "calendars": ("Numeric", "Gregorian"),  # Calendars these names are used with
     },
 
     {
@@ -135,7 +191,8 @@ weekdays_keywords = [
         "language": "persian_ar",
         "priority": 100,  # Highest priority for Persian in Arabic script
         "component": "day",
-        "calendar": "Numeric"  # Weekdays are calendar-independent
+        "calendar": "Numeric",  # Weekdays are calendar-independent
+        "calendars": ("Numeric", "Persian"),  # Calendars these names are used with
     },
 
     {
@@ -154,73 +211,10 @@ weekdays_keywords = [
         "language": "persian_en",
         "priority": 100,  # Highest priority for Persian in Latin script
         "component": "day",
-        "calendar": "Numeric"  # Weekdays are calendar-independent
-    },
-    {
-        "name": "weekdays_ar",
-        "keywords": weekdays_ar,
-        "normalized": "",
-        "description": "Arabic weekday names",
-        "examples": [
-            "الأحد",  # Sunday
-            "الاثنين",  # Monday
-            "الثلاثاء",  # Tuesday
-            "الأربعاء",  # Wednesday
-            "الخميس",  # Thursday
-            "الجمعة",  # Friday
-            "السبت"   # Saturday
-        ],
-        "language": "ar",
-        "priority": 100,
-        "component": "day",
-        "calendar": "Gregorian"
-    },
-    {
-        "name": "weekdays_en",
-        "keywords": weekdays_en,
-        "normalized": "",
-        "description": "English weekday names",
-        "examples": [
-            "monday", "tuesday", "wednesday", "thursday",
-            "friday", "saturday", "sunday",
-            "mon", "tue", "wed", "thu", "fri", "sat", "sun"
-        ],
-        "language": "en",
-        "priority": 100,
-        "component": "day",
-        "calendar": "Gregorian"
-    },
-    {
-        "name": "weekdays_fa_en",
-        "keywords": weekdays_fa_en,
-        "normalized": "",
-        "description": "Persian weekday names in Latin script",
-        "examples": [
-            "shanbeh", "yekshanbeh", "doshanbeh", "seshhanbeh",
-            "chaharshanbeh", "panjshanbeh", "jomeh"
-        ],
-        "language": "persian_en",
-        "priority": 90,
-        "component": "day",
-        "calendar": "Persian"
-    },
-    {
-        "name": "weekdays_fa_ar",
-        "keywords": weekdays_fa_ar,
-        "normalized": "",
-        "description": "Persian weekday names in Arabic script",
-        "examples": [
-            "شنبه",      # Saturday
-            "یکشنبه",    # Sunday
-            "دوشنبه",    # Monday
-            "سه‌شنبه",   # Tuesday
-            "چهارشنبه",  # Wednesday
-            "پنج‌شنبه",  # Thursday
-            "جمعه"      # Friday
-        ],
-        "language": "persian_ar",
-        "priority": 95,
-        "component": "day",
-        "calendar": "Persian"
+        "calendar": "Numeric",  # Weekdays are calendar-independent
+        "calendars": ("Numeric", "Persian"),  # Calendars these names are used with
     }
 ]
+
+# Freeze the entries: read-only mappings with interned strings and tuple values
+weekdays_keywords = tuple(_freeze_entry(entry) for entry in weekdays_keywords)
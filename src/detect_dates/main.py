@@ -1,4 +1,7 @@
-from datetime import datetime, date
+import calendar
+import re
+from datetime import datetime, date, MINYEAR
+from functools import lru_cache
 from typing import Optional, Union, Dict
 
 # Import path helper to ensure modules directory is in sys.path
@@ -19,6 +22,37 @@ if __name__ == "__main__":
     print("INFO: Run Main File : adding file parent src to path ...")
     setup_src_path()
 
+# strptime directives with a regex fast path, using the same sub-patterns as
+# ``_strptime`` so the accepted inputs are identical
+_DIRECTIVE_PATTERNS = {
+    "Y": r"(?P<year>\d\d\d\d)",
+    "m": r"(?P<month>1[0-2]|0[1-9]|[1-9])",
+    "d": r"(?P<day>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])",
+}
+
+
+@lru_cache(maxsize=None)
+def _compile_date_format(fmt: str) -> Optional["re.Pattern"]:
+    """
+    Compile a ``%Y``/``%m``/``%d`` strptime format into an anchored regex.
+
+    Returns None if the format uses any other directive (or repeats one), in
+    which case callers fall back to ``datetime.strptime``.
+    """
+    parts = re.split(r"%(.)", fmt)
+    directives = parts[1::2]
+    if sorted(directives) != sorted(_DIRECTIVE_PATTERNS):
+        return None
+    # Like ``_strptime``, each whitespace run in the literal text matches any
+    # run of whitespace in the input
+    pattern = "".join(
+        _DIRECTIVE_PATTERNS[part] if i % 2
+        else r"\s+".join(map(re.escape, re.split(r"\s+", part)))
+        for i, part in enumerate(parts)
+    )
+    return re.compile(pattern, re.IGNORECASE)
+
+
 # " / الاحد  | ١٨ محرم ١٤٤٧ هـ 🗓️"
 class DateDetector:
     """Main class for detecting and parsing dates from text"""
@@ -43,10 +77,20 @@ class DateDetector:
             date object if successful, None if parsing fails
         """
         for fmt in self.date_formats:
-            try:
-                return datetime.strptime(date_string, fmt).date()
-            except ValueError:
+            pattern = _compile_date_format(fmt)
+            if pattern is None:
+                try:
+                    return datetime.strptime(date_string, fmt).date()
+                except ValueError:
+                    continue
+
+            # Compiled formats are matched and range-checked without raising
+            match = pattern.fullmatch(date_string)
+            if match is None:
                 continue
+            year, month, day = int(match["year"]), int(match["month"]), int(match["day"])
+            if year >= MINYEAR and day <= calendar.monthrange(year, month)[1]:
+                return date(year, month, day)
         return None
 
     def validate_date(self, year: int, month: int, day: int) -> bool:
@@ -84,15 +128,15 @@ class DateDetector:
         }
 
 from typing import Dict, Pattern
-import re
 
 # Dictionary containing compiled regex patterns for date detection
 DATE_PATTERNS: Dict[str, Pattern] = {
     'iso': re.compile(r'^\d{4}-\d{2}-\d{2}$'),
     'usa': re.compile(r'^(?:0?[1-9]|1[0-2])/(?:0?[1-9]|[12]\d|3[01])/(?:19|20)\d{2}$'),
     'eur': re.compile(r'^(?:0?[1-9]|[12]\d|3[01])\.(?:0?[1-9]|1[0-2])\.(?:19|20)\d{2}$'),
-    'text': re.compile(r'^(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|'
-                      r'Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|'
+    # Month names factored by first letter, so a non-month input fails on one branch
+    'text': re.compile(r'^(?:J(?:an(?:uary)?|u(?:ne?|ly?))|Feb(?:ruary)?|Ma(?:r(?:ch)?|y)|'
+                      r'A(?:pr(?:il)?|ug(?:ust)?)|Sep(?:tember)?|Oct(?:ober)?|'
                       r'Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2},\s+\d{4}$', re.IGNORECASE)
 }
 
@@ -21,6 +21,8 @@ from .era import (
 from .month import (
     normalize_month,  # Main month normalization function
     get_month_info,  # Get month information for a given month name
+    make_month_normalizer,  # normalize_month with fixed target options
+    normalize_month_series,  # normalize_month over a column of months
 )
 
 # Weekday normalization and keywords
@@ -40,7 +42,9 @@ from .numeric_words import (
 
 from .calendar import (
     normalize_calendar_name,
-    get_calendar_info
+    normalize_calendar_names,
+    get_calendar_info,
+    invalidate_calendar_info_cache,
 )
 
 from .calendar_from_era import (
@@ -61,6 +65,8 @@ __all__ = [
     # Month normalization and keywords
     "normalize_month",  # Main month normalization function
     "get_month_info",  # Get month information for a given month name
+    "make_month_normalizer",  # normalize_month with fixed target options
+    "normalize_month_series",  # normalize_month over a column of months
 
     # Weekday normalization and keywords
     "normalize_weekday",  # Main weekday normalization function
@@ -70,7 +76,9 @@ __all__ = [
     "numeric_words_pattern_ar",  # Regex pattern for Arabic numeric words
 
     "normalize_calendar_name",
+    "normalize_calendar_names",
     "get_calendar_info",
+    "invalidate_calendar_info_cache",
     "get_calendar",
     "get_era_info",
     "normalize_calendar_from_era",
@@ -42,39 +42,12 @@ Error handling::
         # Shows supported calendar names
 """
 
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, List, Optional
+import copy
 import os
-
-# Import path helper to ensure modules directory is in sys.path
-# ===================================================================================
-if __name__ == "__main__":
-    # This is necessary for importing other modules in the package structure
-    import sys
-    from pathlib import Path
-    
-    def setup_src_path():
-        """
-        Add the src directory to Python path for proper module importing.
-        
-        This function traverses up the directory structure looking for a 'src'
-        folder and adds it to sys.path if not already present.
-        """
-        current_file = Path(__file__).resolve()
-        parts = current_file.parts
-        
-        # Look for 'src' directory in the path hierarchy
-        for i, part in enumerate(parts):
-            if part == 'src' and i + 2 < len(parts):
-                src_second_path = str(Path(*parts[:i + 1]))
-                if src_second_path not in sys.path:
-                    sys.path.insert(0, src_second_path)
-                    print(f"Added to sys.path: {src_second_path}")
-                break
-    
-    print("INFO: Run Main File : adding file parent src to path ...")
-    setup_src_path()
-
-import pandas as pd
+import sys
 
 from detect_dates.keywords.constants import (
     SUPPORTED_CALENDARS_COLUMNS,
@@ -82,6 +55,32 @@ from detect_dates.keywords.constants import (
     CALENDAR_ALIASES,
 )
 
+# Normalized (lowercase) name or alias -> canonical calendar name; aliases win.
+# Keys and values are interned so probes with interned input compare by identity.
+_CALENDAR_LOOKUP = {
+    sys.intern(name.lower()): sys.intern(name) for name in SUPPORTED_CALENDARS_COLUMNS
+}
+_CALENDAR_LOOKUP.update(
+    (sys.intern(alias), sys.intern(name)) for alias, name in CALENDAR_ALIASES.items()
+)
+
+# Unsupported-calendar error message; the sorted name list is rendered once
+_UNSUPPORTED_CALENDAR_MESSAGE = (
+    "Unsupported calendar system: '{}'. Supported systems: "
+    + repr(sorted([*SUPPORTED_CALENDARS_COLUMNS, *CALENDAR_ALIASES]))
+)
+
+# Read-only view of the aliases handed out by get_calendar_info
+_CALENDAR_ALIASES_VIEW = MappingProxyType(CALENDAR_ALIASES)
+
+# Columns of the sample record, in (day, month, year) order per calendar
+_SAMPLE_COLUMNS = (
+    *SUPPORTED_CALENDARS_COLUMNS['gregorian'],
+    *SUPPORTED_CALENDARS_COLUMNS['hijri'],
+    *SUPPORTED_CALENDARS_COLUMNS['Jalali'],
+    WEEKDAY_COLUMN,
+)
+
 
 def normalize_calendar_name(calendar: Optional[str]) -> Optional[str]:
     """
@@ -130,30 +129,71 @@ def normalize_calendar_name(calendar: Optional[str]) -> Optional[str]:
     The function performs the following checks in order:
     1. Returns None for None input
     2. Converts input to lowercase and strips whitespace
-    3. Checks calendar aliases first
-    4. Checks direct matches in supported calendars
-    5. Raises ValueError with helpful message if no match found
+    3. Looks the name up in a table of aliases and supported calendars,
+       built once at import; aliases take precedence
+    4. Raises ValueError with helpful message if no match found
     """
     if calendar is None:
         return None
-    
-    # Normalize input: lowercase and strip whitespace
-    calendar = calendar.lower().strip()
 
-    # Check aliases first (e.g., 'islamic' -> 'hijri')
-    if calendar in CALENDAR_ALIASES:
-        return CALENDAR_ALIASES[calendar]
+    # Already-normalized input (the common programmatic case) skips lower()/strip()
+    result = _CALENDAR_LOOKUP.get(calendar)
+    if result is not None:
+        return result
+    return _lookup_calendar_name(calendar)
 
-    # Check direct matches in supported calendars
-    if calendar in SUPPORTED_CALENDARS_COLUMNS:
-        return calendar
 
-    # Generate helpful error message with all supported options
-    all_names = list(SUPPORTED_CALENDARS_COLUMNS.keys()) + list(CALENDAR_ALIASES.keys())
-    raise ValueError(
-        f"Unsupported calendar system: '{calendar}'. "
-        f"Supported systems: {sorted(all_names)}"
-    )
+def normalize_calendar_names(calendars: Iterable[Optional[str]]) -> List[Optional[str]]:
+    """
+    Normalize many calendar names at once.
+
+    Equivalent to ``[normalize_calendar_name(c) for c in calendars]`` but binds
+    the lookups outside the loop, which removes the per-call overhead when
+    normalizing a whole column (e.g. a pandas Series) of calendar labels.
+
+    Parameters
+    ----------
+    calendars : Iterable[Optional[str]]
+        Calendar names or aliases; None entries stay None.
+
+    Returns
+    -------
+    List[Optional[str]]
+        One normalized calendar name (or None) per input.
+
+    Raises
+    ------
+    ValueError
+        On the first unrecognized calendar name.
+
+    Examples
+    --------
+    >>> normalize_calendar_names(['islamic', None, 'GREGORIAN'])
+    ['hijri', None, 'gregorian']
+    """
+    lookup = _CALENDAR_LOOKUP.get
+    resolve = _lookup_calendar_name
+    results = []
+    for calendar in calendars:
+        if calendar is None:
+            results.append(None)
+        else:
+            results.append(lookup(calendar) or resolve(calendar))
+    return results
+
+
+@lru_cache(maxsize=256)
+def _lookup_calendar_name(calendar: str) -> str:
+    """Resolve a non-None calendar name; cached, as callers repeat a few labels."""
+    # Normalize input: lowercase and strip whitespace
+    calendar = sys.intern(calendar.lower().strip())
+
+    # Aliases and canonical names share one table (e.g., 'islamic' -> 'hijri')
+    result = _CALENDAR_LOOKUP.get(calendar)
+    if result is not None:
+        return result
+
+    raise ValueError(_UNSUPPORTED_CALENDAR_MESSAGE.format(calendar))
 
 
 def get_calendar_info(self) -> Dict[str, Any]:
@@ -173,7 +213,7 @@ def get_calendar_info(self) -> Dict[str, Any]:
         - **data_loaded** (bool): Whether calendar data is successfully loaded
         - **total_records** (int): Number of records in the dataset
         - **supported_calendars** (List[str]): List of supported calendar systems
-        - **calendar_aliases** (Dict[str, str]): Mapping of aliases to calendar names
+        - **calendar_aliases** (Mapping[str, str]): Read-only mapping of aliases to calendar names
         - **date_ranges** (Dict[str, Dict[str, int]]): Min/max years for each calendar
         - **weekdays** (List[str]): Available weekday names in the dataset
         - **csv_columns** (List[str]): Column names in the CSV data
@@ -228,13 +268,34 @@ def get_calendar_info(self) -> Dict[str, Any]:
     The sample record is selected from the middle of the dataset to provide
     a representative example that's likely to contain valid data across
     all calendar systems.
+
+    The result is cached on the instance and rebuilt only when ``self.df`` is
+    replaced; each call returns a deep copy, so mutating a result never
+    affects later calls. Call ``invalidate_calendar_info_cache`` after
+    modifying ``self.df`` in place.
     """
+    cached = getattr(self, '_calendar_info_cache', None)
+    if cached is None or cached[0] is not self.df:
+        cached = (self.df, _build_calendar_info(self))
+        self._calendar_info_cache = cached
+    # The read-only alias view cannot be deep-copied and needs no copy; share it
+    return copy.deepcopy(cached[1], {id(_CALENDAR_ALIASES_VIEW): _CALENDAR_ALIASES_VIEW})
+
+
+def invalidate_calendar_info_cache(self) -> None:
+    """Drop the cached ``get_calendar_info`` result (and sorted weekdays)."""
+    self._calendar_info_cache = None
+    self._weekdays_sorted = None
+
+
+def _build_calendar_info(self) -> Dict[str, Any]:
+    """Build the ``get_calendar_info`` dictionary from scratch."""
     # Build base information that's always available
     base_info = {
         'data_loaded': self.is_data_loaded(),
         'supported_calendars': self.get_supported_calendars(),
-        'calendar_aliases': CALENDAR_ALIASES.copy(),
-        'file_path': os.path.abspath(os.path.join(os.path.dirname(__file__), self.csv_path))
+        'calendar_aliases': _CALENDAR_ALIASES_VIEW,
+        'file_path': _resolve_csv_path(self.csv_path)
     }
     
     # If data is not loaded, return minimal info with error details
@@ -255,7 +316,7 @@ def get_calendar_info(self) -> Dict[str, Any]:
         **base_info,
         'total_records': len(self.df),
         'date_ranges': self.get_data_range(),
-        'weekdays': sorted(self.df[WEEKDAY_COLUMN].unique().tolist()),
+        'weekdays': _get_sorted_weekdays(self),
         'csv_columns': list(self.df.columns),
         'sample_record': {}
     }
@@ -263,15 +324,42 @@ def get_calendar_info(self) -> Dict[str, Any]:
     # Add a representative sample record for reference
     if not self.df.empty:
         # Use middle record for variety (avoids edge cases at start/end)
-        sample_row = self.df.iloc[len(self.df) // 2]
+        # Fetch the needed cells by position in one call instead of per-label lookups;
+        # get_loc raises KeyError for a missing column, as the label lookup did
+        positions = [self.df.columns.get_loc(column) for column in _SAMPLE_COLUMNS]
+        (greg_d, greg_m, greg_y, hijri_d, hijri_m, hijri_y,
+         jalali_d, jalali_m, jalali_y, weekday) = self.df.iloc[len(self.df) // 2, positions].tolist()
         info['sample_record'] = {
-            'gregorian': f"{sample_row['Gregorian Day']}/{sample_row['Gregorian Month']}/{sample_row['Gregorian Year']}",
-            'hijri': f"{sample_row['Hijri Day']}/{sample_row['Hijri Month']}/{sample_row['Hijri Year']}",
-            'Jalali': f"{sample_row['Solar Hijri Day']}/{sample_row['Solar Hijri Month']}/{sample_row['Solar Hijri Year']}",
-            'weekday': sample_row[WEEKDAY_COLUMN]
+            'gregorian': f"{greg_d}/{greg_m}/{greg_y}",
+            'hijri': f"{hijri_d}/{hijri_m}/{hijri_y}",
+            'Jalali': f"{jalali_d}/{jalali_m}/{jalali_y}",
+            'weekday': weekday
         }
     
     # Add data quality metrics for monitoring and validation
     info['data_quality'] = self._get_data_quality_metrics()
     
-    return info
\ No newline at end of file
+    return info
+
+
+@lru_cache(maxsize=None)
+def _resolve_csv_path(csv_path: str) -> str:
+    """Return the absolute path of a CSV path given relative to this module."""
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), csv_path))
+
+
+def _get_sorted_weekdays(self) -> List[str]:
+    """
+    Return the sorted unique weekdays of ``self.df``, cached on the instance.
+
+    The cache is keyed by the DataFrame object, so reloading ``self.df``
+    invalidates it.
+    """
+    cached = getattr(self, '_weekdays_sorted', None)
+    if cached is None or cached[0] is not self.df:
+        # Sort the unique values in C before boxing them into a list;
+        # numpy ships with pandas, so importing it here costs nothing extra
+        import numpy as np
+        cached = (self.df, np.sort(self.df[WEEKDAY_COLUMN].unique()).tolist())
+        self._weekdays_sorted = cached
+    return list(cached[1])
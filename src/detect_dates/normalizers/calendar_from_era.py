@@ -33,44 +33,33 @@ Installation requirements::
     # src/detect_dates/normalizers.py
 """
 
-# Import path helper to ensure modules directory is in sys.path
-# ===================================================================================
-if __name__ == "__main__":
-    # This is necessary for importing other modules in the package structure
-    import sys
-    from pathlib import Path
-    
-    def setup_src_path():
-        """
-        Add the src directory to Python path for proper module importing.
-        
-        This function traverses up the directory structure looking for a 'src'
-        folder and adds it to sys.path if not already present.
-        """
-        current_file = Path(__file__).resolve()
-        parts = current_file.parts
-        
-        # Look for 'src' directory in the path hierarchy
-        for i, part in enumerate(parts):
-            if part == 'src' and i + 2 < len(parts):
-                src_second_path = str(Path(*parts[:i + 1]))
-                if src_second_path not in sys.path:
-                    sys.path.insert(0, src_second_path)
-                    print(f"Added to sys.path: {src_second_path}")
-                break
-    
-    print("INFO: Run Main File : adding file parent src to path ...")
-    setup_src_path()
+from functools import lru_cache
+from typing import Dict, Optional
+from detect_dates.keywords.constants import CALENDAR_ALIASES, SUPPORTED_CALENDARS
+from detect_dates.normalizers import normalize_calendar_name
+
+
+# Calendar names and aliases, checked before the era keywords in one probe
+_KNOWN_CALENDAR_KEYS = SUPPORTED_CALENDARS | frozenset(CALENDAR_ALIASES)
+
+
+@lru_cache(maxsize=None)
+def _build_era_calendar_index() -> Dict[str, str]:
+    """
+    Build the lowercase era keyword -> calendar name table.
 
-from typing import Optional
-from src.detect_dates.keywords.constants import CALENDAR_ALIASES, SUPPORTED_CALENDARS
-from detect_dates.normalizers import (
-    normalize_era,
-    normalize_month, 
-    normalize_weekday,
-    normalize_calendar_name,
-    get_calendar,
-)
+    Built on first use so the era records stay lazy; among era records the
+    first one listing a keyword wins.
+    """
+    # Imported here so the lazily-built era records are only built when needed
+    from detect_dates.keywords import era_keywords
+
+    index = {}
+    for era_record in era_keywords:
+        calendar = normalize_calendar_name(era_record.calendar)
+        for keyword in era_record.keywords:
+            index.setdefault(keyword.lower(), calendar)
+    return index
 
 
 def normalize_calendar_from_era(era: Optional[str]) -> Optional[str]:
@@ -114,32 +103,17 @@ def normalize_calendar_from_era(era: Optional[str]) -> Optional[str]:
     -----
     The function performs the following checks in order:
     1. Returns None for empty/None input
-    2. Checks if input is a supported calendar name
-    3. Checks if input is a calendar alias
-    4. Treats input as era abbreviation and normalizes
-    5. Returns None if no matches found
+    2. Returns supported calendar names as-is and resolves calendar aliases,
+       after one membership test against both
+    3. Looks the input up in a table of era keywords built on first use
+    4. Returns None if no matches found
     """
     if not era:
         return None
-    
-    # Convert to lowercase for case-insensitive comparison
-    era_lower = era.lower()
-    
-    # First, check if input is already a supported calendar name
-    if era_lower in SUPPORTED_CALENDARS:
-        return era_lower
-    
-    # Check if input is a known calendar alias
-    if era_lower in CALENDAR_ALIASES:
-        return CALENDAR_ALIASES[era_lower]
-
-    # Otherwise, treat as era abbreviation and attempt normalization
-    normalized_era = normalize_era(era)
-    if normalized_era:
-        # Get the calendar system associated with this era
-        calendar = get_calendar(normalized_era)
-        if calendar:
-            return normalize_calendar_name(calendar)
-    
-    # Fallback: return None for unrecognized input
-    return None
\ No newline at end of file
+    era_lower = era.lower().strip()
+
+    # Calendar names win over aliases ('persian' is both)
+    if era_lower in _KNOWN_CALENDAR_KEYS:
+        return era_lower if era_lower in SUPPORTED_CALENDARS else CALENDAR_ALIASES[era_lower]
+
+    return _build_era_calendar_index().get(era_lower)
@@ -9,32 +9,54 @@ Created on Fri Jul 25 23:01:21 2025
     It handles both flat and nested structures, extracting and normalizing components like year, month, day, era, and weekday.
 """
 
-# Import path helper to ensure modules directory is in sys.path
-# ===================================================================================
-if __name__ == "__main__":
-    # This is necessary for importing other modules in the package structure
-    import sys
-    from pathlib import Path
-    def setup_src_path():
-        current_file = Path(__file__).resolve()
-        parts = current_file.parts
-        for i, part in enumerate(parts):
-            if part == 'src' and i + 2 < len(parts):
-                src_second_path = str(Path(*parts[:i + 1]))
-                if src_second_path not in sys.path:
-                    sys.path.insert(0, src_second_path)
-                break
-    print("INFO: Run Main File : adding file parent src to path ...")
-    setup_src_path()
-
-from detect_dates.keywords import era_keywords, era_standard_keywords
+from detect_dates.keywords import era_standard_keywords
 
 
+from functools import lru_cache
 from typing import Optional, Tuple, Set
 import logging
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _build_era_index():
+    """
+    Build the lowercase era keyword -> (calendar, base language, era code) table.
+
+    Built on first use so the era records stay lazy; the first record listing a
+    keyword wins, as in a linear scan of era_keywords.
+    """
+    # Imported here so the lazily-built era records are only built when needed
+    from detect_dates.keywords import era_keywords
+
+    index = {}
+    for era_record in era_keywords:
+        entry = (
+            era_record.calendar,
+            era_record.language.split('_')[0],  # Extract base language
+            era_record.era,
+        )
+        for keyword in era_record.keywords:
+            index.setdefault(keyword.lower(), entry)
+    return index
+
+# Era code -> era_standard_keywords key prefix
+_ERA_STANDARD_PREFIXES = {
+    'AH': 'after_hijrah',
+    'BAH': 'before_hijrah',
+    'CE': 'after_christ',
+    'BC': 'before_christ',
+    'SH': 'after_Jalali',
+    'BSH': 'before_Jalali',
+}
+
+# (era code, language) -> standard era text
+_ERA_TO_STANDARD = {
+    (era_code, lang): era_standard_keywords[f"{prefix}_{lang}"]
+    for era_code, prefix in _ERA_STANDARD_PREFIXES.items()
+    for lang in ('ar', 'en')
+}
+
 def get_era_info(era: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
     Extract calendar type, language and normalized era from input era text.
@@ -63,16 +85,11 @@ def get_era_info(era: str) -> Tuple[Optional[str], Optional[str], Optional[str]]
         logger.error(f"Invalid input type '{type(era)}'. Expected non-empty string.")
         return None, None, None
 
-    # Search in era keywords list
-    search_era = era.lower().strip()
-    for era_config in era_keywords:
-        if search_era in [k.lower() for k in era_config['keywords']]:
-            return (
-                era_config['calendar'],
-                era_config['language'].split('_')[0], # Extract base language
-                era_config['era']
-            )
-            
+    # Single probe into the precomputed keyword index
+    entry = _build_era_index().get(era.lower().strip())
+    if entry is not None:
+        return entry
+
     logger.warning(f"Era '{era}' not found in keyword configurations")
     return None, None, None
 
@@ -106,6 +123,19 @@ def normalize_era(
     >>> normalize_era('CE', to_lang='ar')
     'م'
     """
+    # Normalize string input first so spelling variants share one cache entry
+    if isinstance(era, str):
+        era = era.lower().strip()
+    return _normalize_era_cached(era, to_lang, to_calendar)
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _normalize_era_cached(
+    era: str,
+    to_lang: Optional[str],
+    to_calendar: Optional[str]
+) -> Optional[str]:
+    """Cached body of ``normalize_era``; ``era`` is already lowercased and stripped."""
     # Get info about input era
     detected_calendar, detected_lang, normalized = get_era_info(era)
     if not normalized:
@@ -124,16 +154,8 @@ def normalize_era(
         return None
 
     # Get normalized form for target language
-    try:
-        if target_lang == 'ar':
-            key = f"{normalized.lower()}_ar"
-        else:
-            key = f"{normalized.lower()}_en"
-            
-        return era_standard_keywords.get(key)
-    except Exception as e:
-        logger.error(f"Error normalizing era: {e}")
-        return None
+    return _ERA_TO_STANDARD.get((normalized, target_lang))
+
 
 def get_calendar(era: str) -> Optional[str]:
     """
@@ -10,27 +10,11 @@ Created on Fri Jul 25 23:01:21 2025
     for Gregorian, Hijri (Islamic), and Persian (Jalali) calendars.
 """
 
-# Import path helper to ensure modules directory is in sys.path
-# ===================================================================================
-if __name__ == "__main__":
-    import sys
-    from pathlib import Path
-    def setup_src_path():
-        current_file = Path(__file__).resolve()
-        parts = current_file.parts
-        for i, part in enumerate(parts):
-            if part == 'src' and i + 2 < len(parts):
-                src_second_path = str(Path(*parts[:i + 1]))
-                if src_second_path not in sys.path:
-                    sys.path.insert(0, src_second_path)
-                break
-    print("INFO: Run Main File : adding file parent src to path ...")
-    setup_src_path()
-
 # Import necessary modules
 from detect_dates.keywords import (
     months_standard_keywords,  # Standard month names for different languages and calendars
     months_variations_list,  # All month keywords for normalization
+    resolve_num_month,  # Numeric month string -> month number
     search_in_keywords,
 )
 
@@ -50,48 +34,98 @@ from detect_dates.keywords.constants import (
 )
 
 
-from typing import Union, Tuple, Dict, Optional
+from functools import lru_cache
+from typing import Callable, FrozenSet, Iterable, Union, Tuple, Dict, Optional
 import logging
+import sys
 
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Plain output-format strings, so hot paths skip the Enum attribute chain
+_FORMAT_NUM = OutputFormat.NUMBER.value
+_FORMAT_FULL = OutputFormat.FULL.value
+_FORMAT_ABBR = OutputFormat.ABBREVIATED.value
+
+
+# Calendar and language halves of a "<calendar>_<language>..." key
+_CAL_SET = frozenset(("gregorian", "hijri", "persian"))
+_LANG_SET = frozenset(("ar", "en"))
+
+
+def _scan_key(input_key: str):
+    """Detect calendar type and language by splitting the key at its first underscore."""
+    if input_key.startswith("num"):
+        return "num", None
+
+    # One partition() yields both halves; the language may carry a suffix ("en1", "ar_mixed")
+    calendar, _, language = input_key.partition("_")
+    language = language[:2]
+    if calendar in _CAL_SET and language in _LANG_SET:
+        return f"{calendar}_{language}", language
+
+    # Return None values if no match is found
+    return None, None
+
+
+# Every month variation key -> (calendar_type, language), resolved once
+_KEY_TABLE = {key: _scan_key(key) for key in months_variations_list}
+
+# Every month variation key -> interned (calendar, language) as get_month_info
+# reports them, e.g. "gregorian_ar_levantine" -> ("gregorian", "ar")
+_KEY_CALENDAR_LANG = {
+    key: (
+        sys.intern(calendar_type.replace(f"_{lang}", "")),
+        sys.intern(lang) if lang is not None else None,
+    )
+    for key, (calendar_type, lang) in _KEY_TABLE.items()
+    if calendar_type is not None
+}
+
+# (calendar, language) -> the 12 full month names
+_FULL_MONTH_NAMES = {
+    (calendar, lang): tuple(months_standard_keywords[f"{calendar}_{lang}"])
+    for calendar in ("gregorian", "hijri", "persian")
+    for lang in ("ar", "en")
+    if f"{calendar}_{lang}" in months_standard_keywords
+}
+
+# Every exact month variation spelling, normalized as search_in_keywords does
+_ALL_MONTH_VARIATIONS = frozenset(
+    variation.lower().strip()
+    for variations in months_variations_list.values()
+    for variation in variations
+)
+
+# English Gregorian abbreviations ("Jan".."Dec")
+_GREGORIAN_EN_ABBR = tuple(months_standard_keywords.get("gregorian_en_abbr", ()))
 
 
 def normalize_key(input_key: str):
     """
     Detect calendar type and language from input key.
 
+    Keys of ``months_variations_list`` resolve with one dict lookup; any other
+    key falls back to a prefix scan.
+
     Args:
         input_key (str): The input key indicating calendar type and language
 
     Returns:
         tuple: (calendar_type, language) or (None, None) if no match found
     """
-    # Define supported calendar types with their language variants
-    supported_calendar_types = [
-        "num",
-        "gregorian_ar", "hijri_ar", "persian_ar",
-        "gregorian_en", "hijri_en", "persian_en"
-    ]
-
-    # Check each calendar type to find a match
-    for calendar_type in supported_calendar_types:
-        if input_key.startswith(calendar_type):
-            if calendar_type == "num":
-                return "num", None
-            language = "ar" if calendar_type.endswith("ar") else "en"
-            return calendar_type, language
-
-    # Return None values if no match is found
-    return None, None
+    hit = _KEY_TABLE.get(input_key)
+    if hit is not None:
+        return hit
+    return _scan_key(input_key)
 
 
 # ===================================================================================
 # HELPER FUNCTIONS
 # ===================================================================================
 
+@lru_cache(maxsize=2048, typed=True)
 def get_month_info(month: Optional[Union[str, int]]) -> Tuple[Optional[str], Optional[str], Optional[int]]:
     """
     Extract calendar type, language, and month index from month name input.
@@ -116,46 +150,85 @@ def get_month_info(month: Optional[Union[str, int]]) -> Tuple[Optional[str], Opt
         ('hijri', 'ar', 0)
 
         >>> get_month_info(1)
-        (None, None, 0)  # Generic month number, no specific calendar/language
+        ('num', None, 0)  # Generic month number, no specific calendar/language
 
     Note:
         - Input is case-insensitive and whitespace is stripped for strings
         - Returns (None, None, None) if month not found in any calendar system
-        - For integer input (1-12), returns (None, None, month_index) since no specific calendar is implied
+        - For integer input (1-12), returns ('num', None, month_index) since no specific calendar is implied
         - Supports multiple calendar systems: Gregorian, Hijri (Islamic), Persian (Jalali)
+        - Results are cached (``get_month_info.cache_clear()`` resets the cache), so
+          a repeated unknown month is only logged the first time
     """
     if month is None:
         return None, None, None
-    
-    # Handle integer input
-    if isinstance(month, int) or (isinstance(month, str) and month.isdigit()):
-        if 1 > int(month) > 12:
-            logger.warning(f"Invalid month number '{month}'. Must be between 1 and 12.")
-            return None, None, None
-        else:
-            return "num", None, int(month) - 1
 
-    # Input validation for string
-    if not isinstance(month, str) or not month.strip():
-        logger.error(f"Invalid input type {month} '{type(month)}'. Expected str or int.")
+    # Handle integer input before any string work
+    if isinstance(month, int):
+        if 1 <= month <= 12:
+            return "num", None, month - 1
+        logger.warning("Invalid month number '%s'. Must be between 1 and 12.", month)
         return None, None, None
 
-    # Normalize inputs
-    search_month = str(month).lower().strip()
+    # Handle numeric string input ("1".."12", "01".."12") via the lookup table
+    if isinstance(month, str) and month.isdecimal():
+        month_num = resolve_num_month(month)
+        if month_num is None:
+            logger.warning("Invalid month number '%s'. Must be between 1 and 12.", month)
+            return None, None, None
+        return "num", None, month_num - 1
+
+    # Input validation for string; normalize once and reuse the result
+    search_month = month.lower().strip() if isinstance(month, str) else ""
+    if not search_month:
+        logger.error("Invalid input type %s '%s'. Expected str or int.", month, type(month))
+        return None, None, None
 
     # Search for month in keywords
     matching_key, detected_idx = search_in_keywords(search_month, months_variations_list)
 
     if matching_key is None:
-        logger.warning(f"Month '{month}' not found in any keyword list")
+        logger.warning("Month '%s' not found in any keyword list", month)
         return None, None, None
 
-    detected_key, detected_lang = normalize_key(matching_key)
-    if detected_key is not None:
-        detected_calendar = detected_key.replace(f"_{detected_lang}", "")
-        return detected_calendar, detected_lang, detected_idx
-    else:
+    detected = _KEY_CALENDAR_LANG.get(matching_key)
+    if detected is None:
         return None, None, None
+    return detected[0], detected[1], detected_idx
+
+def _to_num(idx: Optional[int], calendar: Optional[str] = None, lang: Optional[str] = None) -> Optional[int]:
+    """Convert 0-based index to 1-based month number; calendar and language are ignored."""
+    return idx + 1 if idx is not None and 0 <= idx <= 11 else None
+
+
+def _to_full(idx: Optional[int], calendar: Optional[str], lang: Optional[str]) -> Optional[str]:
+    """Convert to full month name."""
+    if idx is None or not (0 <= idx <= 11):
+        return None
+    names = _FULL_MONTH_NAMES.get((calendar, lang))
+    return names[idx] if names is not None else None
+
+
+def _to_abbr(idx: Optional[int], calendar: Optional[str], lang: Optional[str]) -> Optional[str]:
+    """Convert to abbreviated month name."""
+    if idx is None or calendar is None or not (0 <= idx <= 11):
+        return None
+
+    # Special case for Gregorian English abbreviations
+    if _GREGORIAN_EN_ABBR and lang == "en" and calendar.lower() == "gregorian":
+        return _GREGORIAN_EN_ABBR[idx]
+
+    # Fall back to full name for other calendar/language combinations
+    return _to_full(idx, calendar, lang)
+
+
+# Output format -> converter taking (idx, calendar, lang)
+_MONTH_FORMATTERS = {
+    _FORMAT_NUM: _to_num,
+    _FORMAT_FULL: _to_full,
+    _FORMAT_ABBR: _to_abbr,
+}
+
 
 # ===================================================================================
 # MAIN FUNCTIONS
@@ -191,93 +264,166 @@ def normalize_month(
         >>> normalize_month(1, to_lang="en", to_calendar="gregorian", output_format="abbr")
         "Jan"
     """
+    # Normalize string input first so spelling variants share one cache entry
+    if isinstance(month, str):
+        month = month.lower().strip()
+    return _normalize_month_cached(month, to_lang, to_calendar, output_format)
 
-    def _to_num(idx: Optional[int]) -> Optional[int]:
-        """Convert 0-based index to 1-based month number."""
-        return idx + 1 if idx is not None and 0 <= idx <= 11 else None
 
-    def _to_full(idx: Optional[int], calendar: Optional[str], lang: Optional[str]) -> Optional[str]:
-        """Convert to full month name."""
-        if idx is None or calendar is None or lang is None:
-            return None
-        if not (0 <= idx <= 11):
-            return None
+@lru_cache(maxsize=4096, typed=True)
+def _normalize_month_cached(
+    month: Optional[Union[int, str]],
+    to_lang: Optional[str],
+    to_calendar: Optional[str],
+    output_format: Optional[str]
+) -> Optional[Union[str, int]]:
+    """Cached body of ``normalize_month``; ``month`` is already lowercased and stripped."""
+    # Get month information
+    detected_calendar, detected_lang, detected_idx = get_month_info(month)
 
-        try:
-            key = f"{calendar}_{lang}"
-            if key in months_standard_keywords:
-                return months_standard_keywords[key][idx]
-        except (KeyError, IndexError) as e:
-            logger.error(f"Error accessing month data for {key}[{idx}]: {e}")
+    if detected_idx is None:
         return None
 
-    def _to_abbr(idx: Optional[int], calendar: Optional[str], lang: Optional[str]) -> Optional[str]:
-        """Convert to abbreviated month name."""
-        if idx is None or calendar is None or lang is None:
-            return None
-        if not (0 <= idx <= 11):
+    # Determine output format; month numbers need no target language or calendar
+    format_type = output_format or _FORMAT_NUM
+    if format_type == _FORMAT_NUM:
+        return _to_num(detected_idx)
+
+    # Target language and calendar default to the detected ones
+    target_lang = _resolve_target_lang(to_lang) or detected_lang
+    target_calendar = _resolve_target_calendar(to_calendar) or detected_calendar
+
+    # Convert based on requested format
+    return _get_month_formatter(format_type)(detected_idx, target_calendar, target_lang)
+
+
+def make_month_normalizer(
+    to_lang: Optional[str] = None,
+    to_calendar: Optional[str] = None,
+    output_format: Optional[str] = None
+) -> Callable[[Optional[Union[int, str]]], Optional[Union[str, int]]]:
+    """
+    Build a one-argument ``normalize_month`` with fixed target options.
+
+    The target language, calendar and output format are resolved once, so
+    converting a long column of months with the same options only pays for
+    the month lookup itself.
+
+    Args:
+        to_lang (Optional[str]): Target language, as for ``normalize_month``.
+        to_calendar (Optional[str]): Target calendar, as for ``normalize_month``.
+        output_format (Optional[str]): Output format, as for ``normalize_month``.
+
+    Returns:
+        Callable: ``normalizer(month)``, equal to
+        ``normalize_month(month, to_lang, to_calendar, output_format)``.
+
+    Examples:
+        >>> to_hijri_ar = make_month_normalizer("ar", "hijri", "full")
+        >>> [to_hijri_ar(m) for m in ("January", "February")]
+        ['محرم', 'صفر']
+    """
+    target_lang = _resolve_target_lang(to_lang)
+    target_calendar = _resolve_target_calendar(to_calendar)
+    formatter = _get_month_formatter(output_format or _FORMAT_NUM)
+
+    def normalizer(month: Optional[Union[int, str]]) -> Optional[Union[str, int]]:
+        if isinstance(month, str):
+            month = month.lower().strip()
+        detected_calendar, detected_lang, detected_idx = get_month_info(month)
+        if detected_idx is None:
             return None
+        return formatter(
+            detected_idx, target_calendar or detected_calendar, target_lang or detected_lang
+        )
 
-        try:
-            # Special case for Gregorian English abbreviations
-            if calendar.lower() == "gregorian" and lang == "en":
-                abbr_key = "gregorian_en_abbr"
-                if abbr_key in months_standard_keywords:
-                    return months_standard_keywords[abbr_key][idx]
-
-            # Fall back to full name for other calendar/language combinations
-            return _to_full(idx, calendar, lang)
-        except Exception as e:
-            logger.error(f"Error getting abbreviated month: {e}")
-        return None
+    return normalizer
 
-    # Get month information
-    detected_calendar, detected_lang, detected_idx = get_month_info(month)
 
-    if detected_idx is None:
-        return None
+def normalize_month_series(
+    months: Iterable[Optional[Union[int, str]]],
+    to_lang: Optional[str] = None,
+    to_calendar: Optional[str] = None,
+    output_format: Optional[str] = None
+):
+    """
+    Normalize a whole column of months, converting each distinct value once.
+
+    Month columns repeat a handful of values, so the unique values are
+    normalized and the result is mapped back onto the column. This avoids a
+    ``normalize_month`` call per cell, as ``Series.apply`` would make.
 
-    # Determine target language
-    target_lang = detected_lang
+    Args:
+        months: A pandas Series (anything with ``dropna``, ``unique`` and
+            ``map``), or any other iterable of month names and numbers.
+        to_lang (Optional[str]): Target language, as for ``normalize_month``.
+        to_calendar (Optional[str]): Target calendar, as for ``normalize_month``.
+        output_format (Optional[str]): Output format, as for ``normalize_month``.
+
+    Returns:
+        A Series with the same index when given a Series, otherwise a list with
+        one normalized month (or None) per input.
+
+    Examples:
+        >>> normalize_month_series(["Jan", "jan", "محرم", None], output_format="full")
+        ['January', 'January', 'محرم', None]
+    """
+    normalizer = make_month_normalizer(to_lang, to_calendar, output_format)
+
+    # pandas Series: map the unique values back through an index lookup in C;
+    # missing cells (None/NaN) stay missing instead of going through the normalizer
+    if hasattr(months, "unique") and hasattr(months, "map"):
+        return months.map(
+            {month: normalizer(month) for month in months.dropna().unique()},
+            na_action="ignore",
+        )
+
+    results = {}
+    return [
+        results[month] if month in results else results.setdefault(month, normalizer(month))
+        for month in months
+    ]
+
+
+def _resolve_target_lang(to_lang: Optional[str]) -> Optional[str]:
+    """Return the supported, lowercased target language, or None to keep the detected one."""
     if to_lang and to_lang.lower() in SUPPORTED_LANGUAGES:
-        target_lang = to_lang.lower()
+        return to_lang.lower()
+    return None
+
 
-    # Determine target calendar
-    target_calendar = detected_calendar
+def _resolve_target_calendar(to_calendar: Optional[str]) -> Optional[str]:
+    """Return the supported target calendar, or None to keep the detected one."""
     if to_calendar:
         calendar_lower = to_calendar.lower().strip()
         if calendar_lower in SUPPORTED_CALENDARS:
-            target_calendar = calendar_lower
             # Special handling for Jalali calendar
             if calendar_lower == "Jalali":
-                target_calendar = "persian"  # Jalali maps to Persian calendar
+                return "persian"  # Jalali maps to Persian calendar
+            return calendar_lower
+    return None
 
-    # Determine output format
-    format_type = output_format or OutputFormat.NUMBER.value
 
-    # Convert based on requested format
-    if format_type == OutputFormat.NUMBER.value:
-        return _to_num(detected_idx)
-    elif format_type == OutputFormat.FULL.value:
-        return _to_full(detected_idx, target_calendar, target_lang)
-    elif format_type == OutputFormat.ABBREVIATED.value:
-        return _to_abbr(detected_idx, target_calendar, target_lang)
-    else:
-        logger.warning(f"Unknown output format '{format_type}'. Defaulting to number.")
-        return _to_num(detected_idx)
+def _get_month_formatter(format_type: str) -> Callable:
+    """Return the converter for an output format, defaulting to the month number."""
+    formatter = _MONTH_FORMATTERS.get(format_type)
+    if formatter is None:
+        logger.warning("Unknown output format '%s'. Defaulting to number.", format_type)
+        formatter = _to_num
+    return formatter
 
 
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
 
-def get_supported_languages() -> set:
+def get_supported_languages() -> FrozenSet[str]:
     """Return set of supported languages."""
-    return SUPPORTED_LANGUAGES.copy()
+    return SUPPORTED_LANGUAGES
 
-def get_supported_calendars() -> set:
+def get_supported_calendars() -> FrozenSet[str]:
     """Return set of supported calendars."""
-    return SUPPORTED_CALENDARS.copy()
+    return SUPPORTED_CALENDARS
 
 def is_valid_month_name(month: str) -> bool:
     """
@@ -289,10 +435,13 @@ def is_valid_month_name(month: str) -> bool:
     Returns:
         bool: True if valid month name, False otherwise
     """
-    if not isinstance(month, str) or not month.strip():
+    search_month = month.lower().strip() if isinstance(month, str) else ""
+    if not search_month:
         return False
 
-    search_month = month.lower().strip()
-    matching_key, _ = search_in_keywords(search_month, months_variations_list)
+    if search_month in _ALL_MONTH_VARIATIONS:
+        return True
 
+    # Fall back to the full search, which also matches Arabic spelling variants
+    matching_key, _ = search_in_keywords(search_month, months_variations_list)
     return matching_key is not None
\ No newline at end of file
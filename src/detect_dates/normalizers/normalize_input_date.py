@@ -57,47 +57,27 @@ Supported calendar systems::
     processor.normalize_input_date("BCE", 1, 1, 1300)
 """
 
-from typing import Optional, Union, Tuple, List, Dict, Any
-import os
-
-# Import path helper to ensure modules directory is in sys.path
-# ===================================================================================
-if __name__ == "__main__":
-    # This is necessary for importing other modules in the package structure
-    import sys
-    from pathlib import Path
-    
-    def setup_src_path():
-        """
-        Add the src directory to Python path for proper module importing.
-        
-        This function traverses up the directory structure looking for a 'src'
-        folder and adds it to sys.path if not already present.
-        """
-        current_file = Path(__file__).resolve()
-        parts = current_file.parts
-        
-        # Look for 'src' directory in the path hierarchy
-        for i, part in enumerate(parts):
-            if part == 'src' and i + 2 < len(parts):
-                src_second_path = str(Path(*parts[:i + 1]))
-                if src_second_path not in sys.path:
-                    sys.path.insert(0, src_second_path)
-                    print(f"Added to sys.path: {src_second_path}")
-                break
-    
-    print("INFO: Run Main File : adding file parent src to path ...")
-    setup_src_path()
-
-import pandas as pd
+from types import MappingProxyType
+from typing import Optional, Union, Tuple
+import logging
 
 from detect_dates.keywords.constants import (
     SUPPORTED_CALENDARS_COLUMNS,
 )
 
-from month import normalize_month
-from calendar import normalize_calendar_name, get_calendar
-from calendar_from_era import normalize_calendar_from_era
+from detect_dates.normalizers import (
+    normalize_month,
+    normalize_calendar_from_era,
+)
+
+logger = logging.getLogger(__name__)
+
+# Supported (min, max) year per calendar
+_YEAR_RANGES = MappingProxyType({
+    'gregorian': (1900, 2077),
+    'hijri': (1318, 1500),
+    'Jalali': (1278, 1456),
+})
 
 
 def normalize_input_date(
@@ -165,7 +145,7 @@ def normalize_input_date(
         # Invalid day and month (set to None with warnings)
         result = processor.normalize_input_date("AD", 35, "BadMonth", 2024)
         # Returns: ("gregorian", None, None, 2024)
-        # Prints warnings about invalid day and month
+        # Logs warnings about invalid day and month
         
         # String numbers are converted
         result = processor.normalize_input_date("AD", "15", "12", "2024")
@@ -214,34 +194,35 @@ def normalize_input_date(
         )
     
     # Step 2: Validate and normalize day component
+    # Convert string numbers ("5", "15", "١٥") to integers
+    if isinstance(day, str) and day.isdecimal() and len(day) <= 2:
+        day = int(day)
     if not isinstance(day, int) or not (1 <= day <= 31):
-        print(f"Invalid day value: {day}. Must be an integer between 1 and 31.")
-        print(f"Day set to default value: None.")
+        logger.warning("Invalid day value: %s. Must be an integer between 1 and 31. "
+                       "Day set to default value: None.", day)
         day = None
 
     # Step 3: Normalize month component (handle various input formats)
-    # Convert string month names to numbers using normalize_month
     if isinstance(month, str):
-        normalized_month = normalize_month(month, output_format="number")
-        if normalized_month is None:
-            print(f"Invalid month name: '{month}'. Could not normalize to month number.")
-            month = None
+        if month.isdecimal() and len(month) <= 2:
+            # String numbers need no keyword lookup
+            month = int(month)
         else:
+            # Convert month names to numbers using normalize_month
+            normalized_month = normalize_month(month, output_format="num")
+            if normalized_month is None:
+                logger.warning("Invalid month name: '%s'. Could not normalize to month number.", month)
             month = normalized_month
     
-    # Convert string numbers to integers
-    if isinstance(month, str) and month.isdigit():
-        month = int(month)
-    
     # Final validation: ensure month is valid integer in range 1-12
     if month is not None and (not isinstance(month, int) or not (1 <= month <= 12)):
-        print(f"Invalid month value: {month}. Must be an integer between 1 and 12.")
-        print(f"Month set to default value: None.")
+        logger.warning("Invalid month value: %s. Must be an integer between 1 and 12. "
+                       "Month set to default value: None.", month)
         month = None
     
     # Step 4: Normalize year component  
     # Convert string numbers to integers
-    if isinstance(year, str) and year.isdigit():
+    if isinstance(year, str) and year.isdecimal():
         year = int(year)
     
     # Year must be an integer (strict validation)
@@ -249,13 +230,7 @@ def normalize_input_date(
         raise ValueError(f"Year must be an integer value. Got: {year}")
     
     # Step 5: Validate year range based on calendar system
-    year_ranges = {
-        'gregorian': (1900, 2077),
-        'hijri': (1318, 1500), 
-        'Jalali': (1278, 1456)
-    }
-    
-    min_year, max_year = year_ranges.get(calendar, (None, None))
+    min_year, max_year = _YEAR_RANGES.get(calendar, (None, None))
     
     # Ensure year is within supported range for the calendar
     if (min_year is None or max_year is None or 
@@ -6,24 +6,6 @@ Created on Sun Jun 22 21:38:10 2025
 @description: This module provides weekday name extraction and normalization utilities.
 '''
 
-# Import path helper to ensure modules directory is in sys.path
-# ===================================================================================
-if __name__ == "__main__":
-    # This is necessary for importing other modules in the package structure
-    import sys
-    from pathlib import Path
-    def setup_src_path():
-        current_file = Path(__file__).resolve()
-        parts = current_file.parts
-        for i, part in enumerate(parts):
-            if part == 'src' and i + 2 < len(parts):
-                src_second_path = str(Path(*parts[:i + 1]))
-                if src_second_path not in sys.path:
-                    sys.path.insert(0, src_second_path)
-                break
-    print("INFO: Run Main File : adding file parent src to path ...")
-    setup_src_path()
-
 # Import necessary modules
 from detect_dates.keywords import weekdays_keywords  # Import weekday keywords
 
@@ -31,9 +13,14 @@ from detect_dates.keywords import weekdays_keywords  # Import weekday keywords
 from detect_dates.keywords import (
     weekdays_variations_list,  # Variations of weekday names
     weekdays_standard_keywords,  # Normalized weekday names
+    resolve_weekday_token,
     search_in_keywords
 )
+from detect_dates.keywords.constants import OutputFormat
+# Formerly defined here; kept importable as normalizers.weekday.Calendar etc.
+from detect_dates.keywords.constants import Calendar, SUPPORTED_CALENDARS  # noqa: F401
 
+from functools import lru_cache
 from typing import Union, Tuple, Dict, Optional
 import logging
 from enum import Enum
@@ -51,22 +38,15 @@ class Language(Enum):
     FARSI_ARABIC = "fa_ar"
     FARSI_ENGLISH = "fa_en"
 
-class Calendar(Enum):
-    HIJRI = "hijri"
-    GREGORIAN = "gregorian"
-    PERSIAN = "persian"
-    Jalali = "Jalali"
-
-class OutputFormat(Enum):
-    NUMBER = "num"
-    FULL = "full"
-    ABBREVIATED = "abbr"
-
-SUPPORTED_LANGUAGES = {lang.value for lang in Language}
-SUPPORTED_CALENDARS = {cal.value for cal in Calendar}
+SUPPORTED_LANGUAGES = frozenset(lang.value for lang in Language)
 DEFAULT_LANGUAGE = Language.ARABIC.value
 DEFAULT_CALENDAR = ""
 
+# Plain output-format strings, so hot paths skip the Enum attribute chain
+_FORMAT_NUM = OutputFormat.NUMBER.value
+_FORMAT_FULL = OutputFormat.FULL.value
+_FORMAT_ABBR = OutputFormat.ABBREVIATED.value
+
 # Weekday index mapping (0-based)
 WEEKDAY_COUNT = 7
 
@@ -106,6 +86,15 @@ def normalize_key(input_key: str) -> Tuple[Optional[str], Optional[str]]:
     return None, None
 
 
+# resolve_weekday_token language code -> language code reported by get_weekday_info
+_TOKEN_LANGUAGES = {
+    "num": "num",
+    "ar": "ar",
+    "en": "en",
+    "persian_ar": "fa_ar",
+    "persian_en": "en",
+}
+
 
 def get_weekday_info(weekday: Union[str, int]) -> Tuple[Optional[str], Optional[int]]:
     """
@@ -138,23 +127,32 @@ def get_weekday_info(weekday: Union[str, int]) -> Tuple[Optional[str], Optional[
     """
     # Handle integer input
     if isinstance(weekday, int):
-        if 1 > weekday > 7:
-            logger.warning(f"Invalid weekday number '{weekday}'. Must be between 1 and 7.")
+        if not 1 <= weekday <= 7:
+            logger.warning("Invalid weekday number '%s'. Must be between 1 and 7.", weekday)
             return None, None
+        return "num", weekday - 1
 
     # Input validation for string
     if not isinstance(weekday, str) or not weekday.strip():
-        logger.error(f"Invalid input type '{type(weekday)}'. Expected str or int.")
+        logger.error("Invalid input type '%s'. Expected str or int.", type(weekday))
         return None, None
 
     # Normalize inputs
-    search_weekday = str(weekday).lower().strip()
+    search_weekday = weekday.lower().strip()
+
+    # Exact spellings resolve in one probe of the shared keyword index (the first
+    # candidate is the first key listing the spelling); search_in_keywords only
+    # runs for folded Arabic spellings and misses
+    candidates = resolve_weekday_token(search_weekday)
+    if candidates:
+        detected_idx, token_lang = candidates[0]
+        return _TOKEN_LANGUAGES[token_lang], detected_idx
 
     # Search for weekday in keywords
     matching_key, detected_idx = search_in_keywords(search_weekday, weekdays_variations_list)
 
     if matching_key is None:
-        logger.warning(f"weekday '{weekday}' not found in any keyword list")
+        logger.warning("weekday '%s' not found in any keyword list", weekday)
         return None, None
 
     detected_key, detected_lang = normalize_key(matching_key)
@@ -198,6 +196,19 @@ def normalize_weekday(
         >>> normalize_weekday("الأحد", to_lang="en", output_format="full")
         "Sunday"
     """
+    # Normalize string input first so spelling variants share one cache entry
+    if isinstance(weekday, str):
+        weekday = weekday.lower().strip()
+    return _normalize_weekday_cached(weekday, to_lang, output_format)
+
+
+@lru_cache(maxsize=2048, typed=True)
+def _normalize_weekday_cached(
+    weekday: Union[int, str],
+    to_lang: Optional[str],
+    output_format: Optional[str]
+) -> Optional[Union[str, int]]:
+    """Cached body of ``normalize_weekday``; ``weekday`` is already lowercased and stripped."""
 
     def _to_num(idx: Optional[int]) -> Optional[int]:
         """Convert 0-based index to 1-based weekday number."""
@@ -266,19 +277,16 @@ def normalize_weekday(
         target_lang = detected_lang
 
     # Determine output format
-    format_type = output_format.lower() if output_format else OutputFormat.FULL.value
-
-    # Determine output format
-    format_type = output_format or OutputFormat.NUMBER.value
+    format_type = output_format or _FORMAT_NUM
 
     # Convert based on requested format
-    if format_type == OutputFormat.NUMBER.value:
+    if format_type == _FORMAT_NUM:
         return _to_num(detected_idx)
-    elif format_type == OutputFormat.FULL.value:
+    elif format_type == _FORMAT_FULL:
         if target_lang == "num":
             return _to_num(detected_idx)
         return _to_full(detected_idx, target_lang)
-    elif format_type == OutputFormat.ABBREVIATED.value:
+    elif format_type == _FORMAT_ABBR:
         if target_lang == "num":
             return _to_num(detected_idx)
         return _to_abbr(detected_idx, target_lang)
@@ -44,7 +44,6 @@ if __name__ == "__main__":
     setup_src_path()
 
 from detect_dates.keywords import (
-    era_keywords, 
     months_keywords, 
     indicators_keywords, 
     weekdays_keywords, 
@@ -77,6 +76,9 @@ def get_date_patterns(lang: str) -> Tuple[BasePatterns, MonthPatterns, EraPatter
         'محرم|صفر|ربيع الأول|ربيع الآخر|جمادى الأولى|جمادى الآخرة|رجب|شعبان|رمضان|شوال|ذو القعدة|ذو الحجة'
 
     """
+    # Imported here so the lazily-built era records are only built when needed
+    from detect_dates.keywords import era_keywords
+
     # Return all as compiled regex pattern strings
     return BasePatterns(
             weekday         =   get_day_pattern(weekdays_keywords, lang),
@@ -26,7 +26,7 @@ def get_era_pattern(data, lang: str = "ar", calendar: str = None) -> str:
     """Generate regex pattern for era keywords.
 
     Args:
-        data: List of data configurations, each containing language, calendar, and keywords
+        data: Sequence of ``EraRecord`` entries, each exposing language, calendar, and keywords
         lang: Language code to filter by (default: "ar" for Arabic, also supports "en")
         calendar: Optional calendar type to filter by (e.g., "hijri", "gregorian")
 
@@ -42,14 +42,14 @@ def get_era_pattern(data, lang: str = "ar", calendar: str = None) -> str:
         print(f"The Language [{lang}] specified not supported...")
         return r''  # Return empty regex pattern for unsupported languages
 
-    for data_config in data:
+    for era_record in data:
         # Skip if language specified and doesn't match (exact or suffix match)
-        if lang and not data_config["language"].endswith(lang):
+        if lang and not era_record.language.endswith(lang):
             continue
         # Skip if calendar specified and doesn't match
-        if calendar and data_config["calendar"] != calendar:
+        if calendar and era_record.calendar != calendar:
             continue
-        matching_keywords.extend(data_config["keywords"])
+        matching_keywords.extend(era_record.keywords)
 
     return keywords_to_regex(matching_keywords)
 
@@ -67,15 +67,15 @@ def get_month_pattern(data, lang: str = "ar", calendar: str = None) -> str:
         print(f"The Language [{lang}] specified not supported...")
         return r''  # Return empty regex pattern for unsupported languages
 
-    for data_config in data:
-        if data_config["component"] != "month":
+    for month_record in data:
+        if month_record.component != "month":
             continue
-        if lang and not data_config["language"].endswith(lang):
+        if lang and not month_record.language.endswith(lang):
             continue
-        if calendar and data_config["calendar"] != calendar:
+        if calendar and month_record.calendar != calendar:
             continue
         # Collect keywords for the specified calendar
-        matching_keywords.extend(data_config["keywords"])
+        matching_keywords.extend(month_record.keywords)
 
     return keywords_to_regex(matching_keywords)
 
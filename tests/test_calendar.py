@@ -0,0 +1,86 @@
+import pytest
+
+from detect_dates.normalizers import calendar as calendar_utils
+
+
+class FakeMapper:
+    """Minimal stand-in for the mapper class that get_calendar_info is bound to."""
+    csv_path = "mapping.csv"
+
+    get_calendar_info = calendar_utils.get_calendar_info
+
+    def __init__(self, df):
+        self.df = df
+
+    def is_data_loaded(self):
+        return self.df is not None
+
+    def get_supported_calendars(self):
+        return ["gregorian", "hijri", "Jalali"]
+
+    def get_data_range(self):
+        return {"gregorian": {"min_year": 2000, "max_year": 2000}}
+
+    def _get_data_quality_metrics(self):
+        return {"status": "ok"}
+
+
+@pytest.fixture
+def mapper():
+    pd = pytest.importorskip("pandas")
+    return FakeMapper(pd.DataFrame({
+        "Gregorian Day": [1, 2, 3], "Gregorian Month": [1, 1, 1], "Gregorian Year": [2000] * 3,
+        "Hijri Day": [24, 25, 26], "Hijri Month": [9] * 3, "Hijri Year": [1420] * 3,
+        "Solar Hijri Day": [11, 12, 13], "Solar Hijri Month": [10] * 3, "Solar Hijri Year": [1378] * 3,
+        "Week Day": ["Saturday", "Sunday", "Monday"],
+    }))
+
+
+def test_get_calendar_info_sample_record(mapper):
+    info = mapper.get_calendar_info()
+    assert info["total_records"] == 3
+    assert info["weekdays"] == ["Monday", "Saturday", "Sunday"]
+    assert info["sample_record"] == {
+        "gregorian": "2/1/2000", "hijri": "25/9/1420", "Jalali": "12/10/1378", "weekday": "Sunday",
+    }
+
+
+def test_get_calendar_info_results_do_not_share_state(mapper):
+    info = mapper.get_calendar_info()
+    info["weekdays"].append("Someday")
+    info["sample_record"]["weekday"] = "Someday"
+    info["date_ranges"]["gregorian"]["min_year"] = 0
+    info["supported_calendars"].clear()
+
+    fresh = mapper.get_calendar_info()
+    assert fresh["weekdays"] == ["Monday", "Saturday", "Sunday"]
+    assert fresh["sample_record"]["weekday"] == "Sunday"
+    assert fresh["date_ranges"]["gregorian"]["min_year"] == 2000
+    assert fresh["supported_calendars"] == ["gregorian", "hijri", "Jalali"]
+
+
+def test_get_calendar_info_is_rebuilt_when_df_is_replaced(mapper):
+    mapper.get_calendar_info()
+    mapper.df = mapper.df.iloc[:1]
+    assert mapper.get_calendar_info()["weekdays"] == ["Saturday"]
+
+
+def test_get_calendar_info_raises_for_a_missing_sample_column(mapper):
+    mapper.df = mapper.df.drop(columns="Hijri Month")
+    with pytest.raises(KeyError, match="Hijri Month"):
+        mapper.get_calendar_info()
+
+
+def test_normalize_calendar_names():
+    names = ["islamic", None, "GREGORIAN", " Persian ", "solar_hijri", "greg"]
+    assert calendar_utils.normalize_calendar_names(names) == [
+        "hijri", None, "gregorian", "Jalali", "Jalali", "gregorian",
+    ]
+    assert calendar_utils.normalize_calendar_names(name for name in names if name) == [
+        calendar_utils.normalize_calendar_name(name) for name in names if name
+    ]
+
+
+def test_normalize_calendar_names_rejects_unknown_names():
+    with pytest.raises(ValueError, match="mars"):
+        calendar_utils.normalize_calendar_names(["hijri", "mars"])
@@ -0,0 +1,20 @@
+import subprocess
+import sys
+
+
+def _run(code):
+    """Run ``code`` in a fresh interpreter and return what it printed."""
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def test_importing_keywords_does_not_load_the_scan_accelerators():
+    code = "import sys, detect_dates.keywords; " \
+        "print([name for name in ('hyperscan', 'ahocorasick') if name in sys.modules])"
+    assert _run(code) == "[]"
+
+
+def test_importing_normalizers_keeps_the_era_records_lazy():
+    code = "import detect_dates.normalizers, detect_dates.keywords.era as era; " \
+        "print('era_keywords' in vars(era))"
+    assert _run(code) == "False"
@@ -0,0 +1,27 @@
+from detect_dates.keywords import era
+from detect_dates.keywords.constants import EraCode
+from detect_dates.normalizers.era import get_era_info
+
+
+def _record(name):
+    return next(record for record in era.era_keywords if record.name == name)
+
+
+def test_era_code_renders_as_its_value():
+    record = _record("hijri_after_hijrah_arabic_standard")
+    assert record.normalized is EraCode.AH_AR
+    assert f"{record.normalized}" == "هـ"
+    assert str(record.normalized) == "هـ"
+    assert "{}".format(EraCode.CE) == "CE"
+    assert " ".join([EraCode.CE, EraCode.AH]) == "CE AH"
+
+
+def test_era_code_compares_equal_to_plain_strings():
+    assert EraCode.AH_AR == "هـ"
+    assert {"هـ": 1}[EraCode.AH_AR] == 1
+
+
+def test_get_era_info():
+    assert get_era_info(" هـ ") == ("Hijri", "ar", "AH")
+    assert get_era_info("ce") == ("Gregorian", "en", "CE")
+    assert get_era_info("nope") == (None, None, None)
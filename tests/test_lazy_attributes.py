@@ -0,0 +1,52 @@
+import pytest
+
+import detect_dates.keywords as keywords
+from detect_dates.keywords import era, month
+from detect_dates.keywords._util import _lazy_module_attributes
+
+
+LAZY_NAMES = [
+    (era, "era_keywords"),
+    (era, "era_keywords_ar"),
+    (era, "IS_ERA_WORD_EN"),
+    (month, "IS_MONTH_WORD_AR"),
+    (month, "IS_MONTH_WORD_PERSIAN_EN"),
+    (keywords, "era_keywords"),
+    (keywords, "IS_MONTH_WORD_EN"),
+]
+
+
+def test_lazy_module_attributes_builds_each_value_once():
+    calls = []
+    module_globals = {"__name__": "fake"}
+    materialize, getattr_, dir_ = _lazy_module_attributes(
+        module_globals, {"table": lambda: calls.append(1) or {"built": True}}
+    )
+
+    assert "table" in dir_()
+    assert "table" not in module_globals
+    value = getattr_("table")
+    assert value == {"built": True}
+    assert module_globals["table"] is value
+    assert materialize("table") is value
+    assert calls == [1]
+
+
+def test_lazy_module_attributes_rejects_unknown_names():
+    _, getattr_, _ = _lazy_module_attributes({"__name__": "fake"}, {})
+    with pytest.raises(AttributeError, match="module 'fake' has no attribute 'missing'"):
+        getattr_("missing")
+
+
+@pytest.mark.parametrize("module, name", LAZY_NAMES)
+def test_lazy_names_resolve_and_are_cached(module, name):
+    assert name in dir(module)
+    value = getattr(module, name)
+    assert value
+    assert vars(module)[name] is value
+    assert getattr(module, name) is value
+
+
+def test_package_forwards_the_submodule_values():
+    assert keywords.era_keywords is era.era_keywords
+    assert keywords.IS_MONTH_WORD_EN is month.IS_MONTH_WORD_EN
@@ -0,0 +1,30 @@
+from datetime import date, datetime
+
+import pytest
+
+from detect_dates.main import DateDetector
+
+
+@pytest.mark.parametrize("fmt, text", [
+    ("%d %m %Y", "05 01 2020"),
+    ("%d %m %Y", "05  01 2020"),
+    ("%d %m %Y", "05\t01\n2020"),
+    ("%d %m %Y", "05 01  2020 "),
+    ("%d %m %Y", "0501 2020"),
+    ("%Y-%m-%d", "2020-1-5"),
+    ("%Y-%m-%d", "2020-02-30"),
+    ("%d/%m/%Y", " 5/01/2020"),
+])
+def test_parse_date_agrees_with_strptime(fmt, text):
+    detector = DateDetector()
+    detector.date_formats = [fmt]
+    try:
+        expected = datetime.strptime(text, fmt).date()
+    except ValueError:
+        expected = None
+    assert detector.parse_date(text) == expected
+
+
+def test_parse_date_tries_each_format():
+    assert DateDetector().parse_date("25/12/2020") == date(2020, 12, 25)
+    assert DateDetector().parse_date("not a date") is None
@@ -0,0 +1,76 @@
+import pytest
+
+from detect_dates.keywords import resolve_month_token
+from detect_dates.keywords.month import resolve_num_month
+from detect_dates.normalizers.month import (
+    get_month_info,
+    make_month_normalizer,
+    normalize_month,
+    normalize_month_series,
+)
+
+
+@pytest.mark.parametrize("token, expected", [
+    ("March", ((3, "gregorian"),)),
+    (" JAN ", ((1, "gregorian"),)),
+    ("محرم", ((1, "hijri"),)),
+    ("Farvardin", ((1, "persian"),)),
+    ("3", ((3, "num"),)),
+    ("03", ((3, "num"),)),
+])
+def test_resolve_month_token(token, expected):
+    assert resolve_month_token(token) == expected
+
+
+@pytest.mark.parametrize("token", ["xx", "Mayor", ""])
+def test_resolve_month_token_unknown(token):
+    assert resolve_month_token(token) == ()
+
+
+@pytest.mark.parametrize("token, expected", [("03", 3), ("11", 11), ("٠٣", 3), ("13", None), ("0", None)])
+def test_resolve_num_month(token, expected):
+    assert resolve_num_month(token) == expected
+
+
+@pytest.mark.parametrize("token", ["²", "³1", "①"])
+def test_non_decimal_digits_are_not_month_numbers(token):
+    # str.isdigit() accepts these, but int() rejects them
+    assert resolve_num_month(token) is None
+    assert get_month_info(token) == (None, None, None)
+    assert normalize_month(token) is None
+
+
+_MONTHS = ["Jan", " MARCH ", "محرم", "Farvardin", 3, "12", None, "xx", 13]
+
+
+@pytest.mark.parametrize("options", [
+    (None, None, None),
+    ("ar", "hijri", "full"),
+    ("en", None, "abbr"),
+    (None, "gregorian", "num"),
+])
+def test_make_month_normalizer_matches_normalize_month(options):
+    normalizer = make_month_normalizer(*options)
+    assert [normalizer(month) for month in _MONTHS] == [normalize_month(month, *options) for month in _MONTHS]
+
+
+def test_make_month_normalizer_converts_calendar():
+    to_hijri_ar = make_month_normalizer("ar", "hijri", "full")
+    assert [to_hijri_ar(month) for month in ("January", "February")] == ["محرم", "صفر"]
+
+
+def test_normalize_month_series_list():
+    months = ["Jan", "jan", "محرم", None]
+    assert normalize_month_series(months, output_format="full") == ["January", "January", "محرم", None]
+    assert normalize_month_series(iter(months), "ar", "hijri", "full") == [
+        normalize_month(month, "ar", "hijri", "full") for month in months
+    ]
+
+
+def test_normalize_month_series_keeps_the_series_index():
+    pd = pytest.importorskip("pandas")
+    months = pd.Series(["Jan", "jan", "محرم", None], index=[10, 20, 30, 40])
+    result = normalize_month_series(months, output_format="full")
+    assert list(result.index) == [10, 20, 30, 40]
+    assert result.iloc[:3].tolist() == ["January", "January", "محرم"]
+    assert result.isna().tolist() == [False, False, False, True]
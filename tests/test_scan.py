@@ -0,0 +1,146 @@
+import sys
+
+import pytest
+
+from detect_dates.keywords import scan
+
+
+_ACCELERATORS = ("hyperscan", "ahocorasick")
+
+
+def _use_backend(monkeypatch, name):
+    """Hide every accelerator but ``name`` and drop the compiled scanners."""
+    for accelerator in _ACCELERATORS:
+        if accelerator != name:
+            # A None entry makes ``import accelerator`` raise ImportError
+            monkeypatch.setitem(sys.modules, accelerator, None)
+        else:
+            monkeypatch.delitem(sys.modules, accelerator, raising=False)
+    scan._build_en_scanner.cache_clear()
+    scan._build_indicator_scanner.cache_clear()
+
+
+@pytest.fixture(params=["hyperscan", "ahocorasick", "re"])
+def backend(request, monkeypatch):
+    """Force one scanning backend; the optional ones are skipped when missing."""
+    if request.param != "re":
+        pytest.importorskip(request.param)
+    _use_backend(monkeypatch, request.param)
+    yield request.param
+    scan._build_en_scanner.cache_clear()
+    scan._build_indicator_scanner.cache_clear()
+
+
+def test_compile_keywords_uses_the_requested_backend(backend):
+    assert scan._compile_keywords(("may",))[0] == backend
+
+
+def _scan_en(text):
+    found = []
+    scan.scan_en(text, lambda name, start, end: found.append((name, text[start:end], start, end)))
+    return found
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("15 March 1990 AD", [
+        ("gregorian_months_english_full", "March", 3, 8),
+        ("gregorian_after_christ_english_standard", "AD", 14, 16),
+    ]),
+    ("From JANUARY to Dec. 2020", [
+        ("gregorian_months_english_full", "JANUARY", 5, 12),
+        ("gregorian_months_english_full", "Dec", 16, 19),
+    ]),
+    ("5 BC - 10 AD", [
+        ("gregorian_before_christ_english_standard", "BC", 2, 4),
+        ("gregorian_after_christ_english_standard", "AD", 10, 12),
+    ]),
+    ("Ramadan 1445 AH", [
+        ("hijri_months_english_standard", "Ramadan", 0, 7),
+        ("hijri_after_hijrah_english_standard", "AH", 13, 15),
+    ]),
+])
+def test_scan_en_matches(backend, text, expected):
+    assert _scan_en(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "the mayor will decide in advance",
+    "during the 1990s, from the 5th",
+    "marching orders",
+])
+def test_scan_en_ignores_keywords_inside_words(backend, text):
+    assert _scan_en(text) == []
+
+
+def test_scan_en_prefers_the_longest_overlapping_keyword(backend):
+    # "Mar" and "March" both match at 3; only the longer one is reported
+    assert [match[1] for match in _scan_en("15 March")] == ["March"]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("circa 1445", [(5, "approximation_indicators_english", 70)]),
+    ("during the 1990s, from the 5th", [
+        (6, "year_indicators_english_standard", 100),
+        (17, "date_separators_standard_ar", 50),
+        (26, "range_starters_english", 80),
+    ]),
+    ("2020-2021 until Friday", [
+        (5, "range_connectors_arabic", 80),
+        (15, "range_connectors_english", 80),
+        (22, "weekday_names_english_full", 100),
+    ]),
+    ("من 1 رمضان إلى ٥ شوال", [
+        (2, "range_starters_arabic", 80),
+        (14, "range_connectors_arabic", 80),
+    ]),
+])
+def test_scan_indicators_matches(backend, text, expected):
+    assert scan.scan_indicators(text) == expected
+
+
+def test_scan_indicators_ignores_keywords_inside_words(backend):
+    # "th" (Thursday) inside "the" and "in" inside "gathering" are not reported
+    assert scan.scan_indicators("the gathering") == []
+
+
+def test_scan_indicators_skips_whitespace_separators(backend):
+    assert scan.scan_indicators("1 2 3") == []
+
+
+@pytest.mark.parametrize("component, lang, text, expected", [
+    ("range_starter_indicator", "en", "from the 1990s fromage, since 2000", ["from the", "since"]),
+    ("range_starter_indicator", "ar", "من 1990 منذ", ["من", "منذ"]),
+    ("day", "en", "Friday, thursday", ["Friday", "thursday"]),
+])
+def test_get_indicator_regex(component, lang, text, expected):
+    assert scan.get_indicator_regex(component, lang).findall(text) == expected
+
+
+def test_get_indicator_regex_unknown_component():
+    with pytest.raises(KeyError):
+        scan.get_indicator_regex("nope", "en")
+
+
+def test_char_offsets_maps_utf8_bytes_to_characters():
+    text = "aé١😀b"
+    data = text.encode("utf-8")
+    boundaries = {len(text[:index].encode("utf-8")): index for index in range(len(text) + 1)}
+    assert scan._char_offsets(data, [9, 0, 3, 3, len(data)]) == {
+        offset: boundaries[offset] for offset in (0, 3, 9, len(data))
+    }
+    assert scan._char_offsets(data, boundaries) == boundaries
+
+
+def test_hyperscan_reports_character_offsets_on_non_ascii_text(monkeypatch):
+    pytest.importorskip("hyperscan")
+    text = "من ١٥ March ١٩٩٠ AD إلى Friday"
+
+    results = {}
+    for name in ("hyperscan", "re"):
+        _use_backend(monkeypatch, name)
+        results[name] = (_scan_en(text), scan.scan_indicators(text))
+    scan._build_en_scanner.cache_clear()
+    scan._build_indicator_scanner.cache_clear()
+
+    assert results["hyperscan"] == results["re"]
+    assert [match[1] for match in results["hyperscan"][0]] == ["March", "AD"]
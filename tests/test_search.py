@@ -0,0 +1,73 @@
+import sys
+
+import pytest
+
+from detect_dates.keywords import search
+
+
+@pytest.fixture(params=["hyperscan", "ahocorasick", "re"])
+def backend(request, monkeypatch):
+    """Force one month-matching backend; the optional ones are skipped when missing."""
+    if request.param != "re":
+        pytest.importorskip(request.param)
+    for accelerator in ("hyperscan", "ahocorasick"):
+        if accelerator != request.param:
+            # A None entry makes ``import accelerator`` raise ImportError
+            monkeypatch.setitem(sys.modules, accelerator, None)
+    search._build_month_matcher.cache_clear()
+    yield request.param
+    search._build_month_matcher.cache_clear()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("15 March 1990", [(8, "gregorian_en", 2)]),
+    ("Jan. and Dec", [(3, "gregorian_en2", 0), (12, "gregorian_en2", 11)]),
+    ("in May, then 1 محرم 1445", [(6, "gregorian_en", 4), (19, "hijri_ar", 0)]),
+])
+def test_find_months(backend, text, expected):
+    assert list(search.find_months(text)) == expected
+
+
+def test_find_months_reports_the_longest_overlapping_variation(backend):
+    # "يناير" and "كانون الثاني" are whole words inside "يناير/كانون الثاني"
+    assert list(search.find_months("يناير/كانون الثاني 2020")) == [(18, "gregorian_ar_mixed", 0)]
+    assert list(search.find_months("مارس/آذار")) == [(9, "gregorian_ar_mixed", 2)]
+
+
+def test_find_months_offsets_follow_the_original_text(backend):
+    # "İ" lowercases to two characters; offsets must still index ``text``
+    assert list(search.find_months("İİ May")) == [(6, "gregorian_en", 4)]
+
+
+@pytest.mark.parametrize("text", ["Mayor Decides", "marching orders", "1990-2000"])
+def test_find_months_ignores_names_inside_words(backend, text):
+    assert list(search.find_months(text)) == []
+
+
+def test_search_in_keywords_batch_matches_single_lookups():
+    tokens = ["Jan", "xx", " MARCH ", "إبريل", "ابريل"]
+    results = search.search_in_keywords_batch(tokens, search.months_variations_list)
+    assert results == [search.search_in_keywords(t, search.months_variations_list) for t in tokens]
+    assert results[0] == ("gregorian_en2", 0)
+    assert results[1] == (None, None)
+    # the hamza spelling is folded onto the same month
+    assert results[3] == results[4] == ("gregorian_ar1", 3)
+
+
+def test_get_month_regex_ignores_names_inside_words():
+    pattern = search.get_month_regex("gregorian", "en")
+    assert pattern.findall("May mayor March marching") == ["May", "March"]
+
+
+def test_get_month_regex_unknown_language():
+    with pytest.raises(KeyError):
+        search.get_month_regex("gregorian", "xx")
+
+
+@pytest.mark.parametrize("text, calendar, lang, expected", [
+    ("mayor in May", "gregorian", "en", ("May", 4)),
+    ("١ كانون الأول ٢٠٢٠", "gregorian", "ar", ("كانون الأول", 11)),
+    ("nothing", "hijri", "en", None),
+])
+def test_find_month(text, calendar, lang, expected):
+    assert search.find_month(text, calendar, lang) == expected
@@ -0,0 +1,28 @@
+import pytest
+
+from detect_dates.keywords.separator import match_punctuation_separator, punctuation_separators
+
+
+@pytest.mark.parametrize("text, pos, expected", [
+    ("2023/12/25", 4, "/"),
+    ("2023–12", 4, "–"),
+    ("1 / 2", 1, " "),
+    ("a >> b", 2, ">>"),
+    ("a << b", 2, "<<"),
+])
+def test_match_punctuation_separator(text, pos, expected):
+    assert match_punctuation_separator(text, pos) == expected
+
+
+@pytest.mark.parametrize("text, pos", [
+    ("a > b", 2),  # a lone ">" is only the start of ">>"
+    ("2023", 0),
+    ("x", 5),
+])
+def test_match_punctuation_separator_no_match(text, pos):
+    assert match_punctuation_separator(text, pos) is None
+
+
+@pytest.mark.parametrize("separator", punctuation_separators)
+def test_match_punctuation_separator_finds_every_separator(separator):
+    assert match_punctuation_separator("1" + separator + "2", 1) == separator
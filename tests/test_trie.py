@@ -0,0 +1,66 @@
+import re
+
+import pytest
+
+from detect_dates.keywords import get_month_trie
+from detect_dates.keywords.trie import KeywordTrie
+
+
+@pytest.fixture
+def trie():
+    return KeywordTrie([("rab", 1), ("rabi", 2), ("ramadan", 3)])
+
+
+def test_keyword_trie_lookup(trie):
+    assert len(trie) == 3
+    assert "rab" in trie
+    assert "ra" not in trie
+    assert trie.get("rabi") == 2
+    assert trie.get("ra") is None
+    assert trie.get("ra", 0) == 0
+
+
+def test_keyword_trie_overwrite_keeps_size(trie):
+    trie["rab"] = 9
+    assert len(trie) == 3
+    assert trie.get("rab") == 9
+
+
+@pytest.mark.parametrize("prefix, expected", [
+    ("", [("rab", 1), ("rabi", 2), ("ramadan", 3)]),
+    ("rab", [("rab", 1), ("rabi", 2)]),
+    ("x", []),
+])
+def test_keyword_trie_items(trie, prefix, expected):
+    assert trie.items(prefix) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("rabi al-awwal", ("rabi", 2)),
+    ("rab1", ("rab", 1)),
+    ("x", (None, None)),
+])
+def test_keyword_trie_longest_prefix_item(trie, text, expected):
+    assert trie.longest_prefix_item(text) == expected
+
+
+def test_get_month_trie():
+    months = get_month_trie()
+    assert isinstance(months, KeywordTrie)
+    assert months.get("march") == ("gregorian", "en", 2)
+    assert months.items("jun") == [("jun", ("gregorian", "en", 5)), ("june", ("gregorian", "en", 5))]
+    assert months.longest_prefix_item("marching") == ("march", ("gregorian", "en", 2))
+    assert months.longest_prefix_item("ramadan 1445") == ("ramadan", ("hijri", "en", 8))
+
+
+def test_to_regex_factors_shared_prefixes():
+    keywords = KeywordTrie([("from", 1), ("from the", 2), ("since", 3), ("in", 4)])
+    assert keywords.to_regex() == r"from(?:\ the)?|in|since"
+
+
+def test_to_regex_word_boundaries():
+    keywords = KeywordTrie([("from", 1), ("from the", 2), ("since", 3), ("in", 4)])
+    pattern = re.compile(keywords.to_regex(word_boundaries=True))
+    # "from the" wins over "from", "the" inside "them" and "in" inside "during" do not match
+    assert pattern.findall("from them, since during in from the") == ["from", "since", "in", "from the"]
+    assert pattern.findall("fromage within") == []
@@ -0,0 +1,50 @@
+import pytest
+
+from detect_dates.keywords import resolve_weekday_token
+from detect_dates.normalizers.weekday import get_weekday_info, normalize_weekday
+
+
+@pytest.mark.parametrize("weekday, expected", [
+    ("Sunday", ("en", 0)),
+    ("  FRIDAY ", ("en", 5)),
+    ("thu", ("en", 4)),
+    ("الجمعة", ("ar", 5)),
+    ("الاحد", ("ar", 0)),  # folded spelling of "الأحد"
+    ("شنبه", ("fa_ar", 6)),
+    ("jomeh", ("en", 5)),
+    ("07", ("num", 6)),
+    (1, ("num", 0)),
+    (7, ("num", 6)),
+])
+def test_get_weekday_info(weekday, expected):
+    assert get_weekday_info(weekday) == expected
+
+
+@pytest.mark.parametrize("weekday", ["someday", "", 0, 8, None])
+def test_get_weekday_info_rejects_unknown_input(weekday):
+    assert get_weekday_info(weekday) == (None, None)
+
+
+def test_normalize_weekday_converts_between_languages():
+    assert normalize_weekday("الجمعة", to_lang="en", output_format="full") == "Friday"
+    assert normalize_weekday("Sunday", to_lang="ar", output_format="full") == "الأحد"
+    assert normalize_weekday("Sunday", output_format="num") == 1
+
+
+@pytest.mark.parametrize("token, expected", [
+    ("Friday", ((5, "en"),)),
+    (" friday ", ((5, "en"),)),
+    ("sat", ((6, "en"),)),
+    ("الجمعة", ((5, "ar"),)),
+    ("شنبه", ((6, "persian_ar"),)),
+    ("jomeh", ((5, "persian_en"),)),
+    ("1", ((0, "num"),)),
+    ("07", ((6, "num"),)),
+])
+def test_resolve_weekday_token(token, expected):
+    assert resolve_weekday_token(token) == expected
+
+
+@pytest.mark.parametrize("token", ["x", "", "someday"])
+def test_resolve_weekday_token_unknown(token):
+    assert resolve_weekday_token(token) == ()